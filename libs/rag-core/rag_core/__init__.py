@@ -14,6 +14,7 @@ __version__ = "0.1.0"
 from rag_core.config import EMBEDDING_DIM, validate_embedding_dim
 
 # Export commonly used classes
+from rag_core.schemas.fast import RetrievalResultFast
 from rag_core.schemas.models import Chunk, Citation, Document, RetrievalResult
 from rag_core.stores.pgvector_store import PgVectorStore
 
@@ -23,6 +24,7 @@ __all__ = [
     "Chunk",
     "Document",
     "RetrievalResult",
+    "RetrievalResultFast",
     "Citation",
     "PgVectorStore",
 ]
@@ -1,22 +1,24 @@
 """Configuration constants for rag-core."""
 
+import functools
 import os
 
-# Embedding dimension (OpenAI text-embedding-3-small standard)
-# Can be overridden via RAG_EMBEDDING_DIM environment variable
-EMBEDDING_DIM = int(os.getenv("RAG_EMBEDDING_DIM", "1536"))
-
 # Supported embedding dimensions (for validation)
-SUPPORTED_EMBEDDING_DIMS = {
-    1536,  # text-embedding-3-small, text-embedding-ada-002
-    3072,  # text-embedding-3-large
-}
+SUPPORTED_EMBEDDING_DIMS = frozenset(
+    {
+        1536,  # text-embedding-3-small, text-embedding-ada-002
+        3072,  # text-embedding-3-large
+    }
+)
 
 
+@functools.cache
 def validate_embedding_dim(dim: int) -> None:
     """
     Validate embedding dimension.
 
+    Results are cached per dimension; invalid dimensions raise on every call.
+
     Args:
         dim: Dimension to validate
 
@@ -25,13 +27,37 @@ def validate_embedding_dim(dim: int) -> None:
     """
     if dim not in SUPPORTED_EMBEDDING_DIMS:
         raise ValueError(
-            f"Unsupported embedding dimension: {dim}. " f"Supported: {SUPPORTED_EMBEDDING_DIMS}"
+            f"Unsupported embedding dimension: {dim}. "
+            f"Supported: {sorted(SUPPORTED_EMBEDDING_DIMS)}"
         )
 
 
-# Embedding dimension (OpenAI standard)
+# Embedding dimension (OpenAI text-embedding-3-small standard)
 # Can be overridden via RAG_EMBEDDING_DIM environment variable
-EMBEDDING_DIM = int(os.getenv("RAG_EMBEDDING_DIM", "1536"))
+EMBEDDING_DIM = int(os.environ.get("RAG_EMBEDDING_DIM", "1536"))
 
 # 🔒 Validate at import time so downstream modules can assume correctness
 validate_embedding_dim(EMBEDDING_DIM)
+
+# Store unit-length embeddings and search by inner product, which skips the
+# per-candidate norm computation of cosine distance (same ranking and scores).
+# Disable via RAG_NORMALIZE_EMBEDDINGS=0; changing it requires re-ingesting chunks
+# (ensure_schema refuses to switch an existing index to inner product while any
+# stored embedding is not unit-length).
+NORMALIZE_EMBEDDINGS = os.environ.get("RAG_NORMALIZE_EMBEDDINGS", "1").lower() not in {
+    "0",
+    "false",
+    "no",
+}
+
+# Embedding storage precision: "half" stores halfvec (FP16, half the memory and
+# index size; needs pgvector >= 0.7.0), "full" stores vector (FP32).
+# Can be overridden via RAG_EMBEDDING_PRECISION environment variable
+SUPPORTED_EMBEDDING_PRECISIONS = frozenset({"half", "full"})
+EMBEDDING_PRECISION = os.environ.get("RAG_EMBEDDING_PRECISION", "half")
+
+if EMBEDDING_PRECISION not in SUPPORTED_EMBEDDING_PRECISIONS:
+    raise ValueError(
+        f"Unsupported embedding precision: {EMBEDDING_PRECISION}. "
+        f"Supported: {sorted(SUPPORTED_EMBEDDING_PRECISIONS)}"
+    )
@@ -1,12 +1,72 @@
 """Deterministic (non-LLM) grading implementations for Stage 3."""
 
+import functools
 import logging
 
-from rag_core.schemas.models import GradingResult, RetrievalResult
+from rag_core.schemas.fast import RetrievalResultFast
+from rag_core.schemas.models import GradingResult
+from rag_core.utils.text import token_bits
 
 logger = logging.getLogger(__name__)
 
 
+def _tokenize(text: str) -> frozenset[str]:
+    """Lowercase whitespace tokenization used for keyword overlap."""
+    return frozenset(text.lower().split())
+
+
+@functools.cache
+def _get_ahocorasick():
+    """Lazy import pyahocorasick (returns None if not installed)."""
+    try:
+        import ahocorasick
+
+        return ahocorasick
+    except ModuleNotFoundError:
+        return None
+
+
+def _match_trigrams(trigrams: dict[str, set[int]], context: str, total: int) -> set[int]:
+    """
+    Find which sentences have at least one trigram occurring in context.
+
+    Uses a single Aho-Corasick pass over the context when pyahocorasick is
+    installed (install via [perf] extras), otherwise falls back to one
+    substring scan per trigram.
+
+    Args:
+        trigrams: Map of trigram -> indices of sentences containing it
+        context: Lowercased context text
+        total: Number of sentences (stop early once all are matched)
+
+    Returns:
+        Indices of grounded sentences
+    """
+    matched: set[int] = set()
+    if not trigrams:
+        return matched
+
+    ahocorasick = _get_ahocorasick()
+    if ahocorasick is None:
+        for trigram, sentence_ids in trigrams.items():
+            if not sentence_ids <= matched and trigram in context:
+                matched |= sentence_ids
+                if len(matched) == total:
+                    break
+        return matched
+
+    automaton = ahocorasick.Automaton()
+    for trigram, sentence_ids in trigrams.items():
+        automaton.add_word(trigram, sentence_ids)
+    automaton.make_automaton()
+
+    for _, sentence_ids in automaton.iter(context):
+        matched |= sentence_ids
+        if len(matched) == total:
+            break
+    return matched
+
+
 class DeterministicRelevanceGrader:
     """
     Deterministic relevance grader using keyword overlap.
@@ -40,48 +100,88 @@ class DeterministicRelevanceGrader:
         Returns:
             Grading result
         """
-        query_words = set(query.lower().split())
-        text_words = set(text.lower().split())
+        query_words = _tokenize(query)
+        overlap = len(query_words & _tokenize(text))
+        return self._overlap_result(overlap, len(query_words))
+
+    def grade_batch(self, query: str, results: list[RetrievalResultFast]) -> list[GradingResult]:
+        """
+        Grade multiple results.
+
+        Tokenizes the query once; chunk tokens are cached on each Chunk, so
+        chunks retrieved by many queries are tokenized only once.
 
-        overlap = query_words & text_words
-        score = len(overlap) / len(query_words) if query_words else 0.0
+        Args:
+            query: User query
+            results: Retrieval results to grade
 
+        Returns:
+            List of grading results (same order as results)
+        """
+        query_words = _tokenize(query)
+        query_size = len(query_words)
+        overlaps = [len(query_words & r.chunk.token_set) for r in results]
+        return [self._overlap_result(overlap, query_size) for overlap in overlaps]
+
+    def _overlap_result(self, overlap: int, query_size: int) -> GradingResult:
+        """Build grading result from keyword overlap count."""
+        score = overlap / query_size if query_size else 0.0
         passed = score >= self.threshold
 
         return GradingResult(
             passed=passed,
             score=score,
-            reason=(
-                f"Keyword overlap: {len(overlap)}/{len(query_words)} words" if not passed else None
-            ),
+            reason=f"Keyword overlap: {overlap}/{query_size} words" if not passed else None,
         )
 
-    def grade_batch(self, query: str, results: list[RetrievalResult]) -> list[GradingResult]:
-        """Grade multiple results."""
-        return [self.grade(query, r.chunk.text) for r in results]
-
     def filter_relevant(
-        self, query: str, results: list[RetrievalResult], threshold: float | None = None
-    ) -> list[RetrievalResult]:
+        self,
+        query: str,
+        results: list[RetrievalResultFast],
+        threshold: float | None = None,
+        max_results: int | None = None,
+    ) -> list[RetrievalResultFast]:
         """
         Filter results to only relevant chunks.
 
+        Results are graded in order, so with max_results set the tail of the
+        list is never graded once enough relevant chunks are found. Chunks whose
+        token bitset (cached on the Chunk next to token_set) cannot reach the
+        threshold are rejected with a single AND + popcount, skipping the set
+        intersection.
+
         Args:
             query: User query
-            results: Retrieval results
+            results: Retrieval results (ranked)
             threshold: Override instance threshold
+            max_results: Stop after this many relevant results (None = all)
 
         Returns:
             Filtered results
         """
         thresh = threshold if threshold is not None else self.threshold
-        grades = self.grade_batch(query, results)
+        # Must pass the grader threshold and the (optional) override
+        min_score = max(self.threshold, thresh)
 
-        filtered = [
-            result
-            for result, grade in zip(results, grades, strict=True)
-            if grade.passed and grade.score >= thresh
-        ]
+        query_words = _tokenize(query)
+        query_size = len(query_words)
+
+        # Bitset overlap bounds the true overlap from above only when no two
+        # query tokens share a bit; otherwise grade every result exactly.
+        query_bits = token_bits(query_words)
+        use_bits = query_size > 0 and query_bits.bit_count() == query_size
+
+        filtered: list[RetrievalResultFast] = []
+        for result in results:
+            chunk = result.chunk
+            if use_bits and (query_bits & chunk.token_bits).bit_count() / query_size < min_score:
+                continue
+            overlap = len(query_words & chunk.token_set)
+            score = overlap / query_size if query_size else 0.0
+            if score >= min_score:
+                filtered.append(result)
+                if max_results is not None and len(filtered) >= max_results:
+                    break
 
         logger.debug(f"Filtered {len(results)} → {len(filtered)} relevant chunks")
         return filtered
@@ -104,7 +204,7 @@ class DeterministicGroundednessGrader:
         """
         self.min_substring_length = min_substring_length
 
-    def grade(self, answer: str, context: list[RetrievalResult]) -> GradingResult:
+    def grade(self, answer: str, context: list[RetrievalResultFast]) -> GradingResult:
         """
         Grade using substring matching.
 
@@ -119,31 +219,34 @@ class DeterministicGroundednessGrader:
         Returns:
             Grading result
         """
-        # Concatenate context
-        context_text = " ".join([r.chunk.text for r in context])
+        # Concatenate and lowercase context once
+        context_lower = " ".join(r.chunk.text for r in context).lower()
 
-        # Split answer into sentences (simple split on .)
+        # Split answer into sentences (simple split on .), lowercased once
         sentences = [
-            s.strip() for s in answer.split(".") if len(s.strip()) > self.min_substring_length
+            s
+            for s in (part.strip() for part in answer.lower().split("."))
+            if len(s) > self.min_substring_length
         ]
 
         if not sentences:
             return GradingResult(passed=True, score=1.0, reason="No sentences to check")
 
-        # Count how many sentences have substantial overlap with context
-        matched = 0
-        for sentence in sentences:
-            # Check if significant portion of sentence appears in context
-            words = sentence.lower().split()
-            if len(words) < 3:
-                continue
+        # A trigram "a b c" can only occur in context if "b" is a whole context
+        # token (it is space-delimited on both sides), so one set probe rules
+        # out most trigrams before any substring matching.
+        context_tokens = frozenset(context_lower.split())
 
-            # Check for n-gram matches (simple heuristic)
+        # Collect word trigrams per sentence (sentences under 3 words can't match)
+        trigrams: dict[str, set[int]] = {}
+        for idx, sentence in enumerate(sentences):
+            words = sentence.split()
             for i in range(len(words) - 2):
-                trigram = " ".join(words[i : i + 3])
-                if trigram in context_text.lower():
-                    matched += 1
-                    break
+                if words[i + 1] in context_tokens:
+                    trigrams.setdefault(" ".join(words[i : i + 3]), set()).add(idx)
+
+        # A sentence is grounded if any of its trigrams appears in context
+        matched = len(_match_trigrams(trigrams, context_lower, len(sentences)))
 
         score = matched / len(sentences) if sentences else 0.0
         passed = score >= 0.5  # At least 50% of sentences grounded
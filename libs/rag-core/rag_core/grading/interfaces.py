@@ -2,7 +2,8 @@
 
 from typing import Protocol
 
-from rag_core.schemas.models import GradingResult, RetrievalResult
+from rag_core.schemas.fast import RetrievalResultFast
+from rag_core.schemas.models import GradingResult
 
 
 class RelevanceGraderProtocol(Protocol):
@@ -26,7 +27,7 @@ class RelevanceGraderProtocol(Protocol):
         """
         ...
 
-    def grade_batch(self, query: str, results: list[RetrievalResult]) -> list[GradingResult]:
+    def grade_batch(self, query: str, results: list[RetrievalResultFast]) -> list[GradingResult]:
         """
         Grade multiple results.
 
@@ -48,7 +49,7 @@ class GroundednessGraderProtocol(Protocol):
     Stage 5+: LLM-based GroundednessGrader (OpenAI)
     """
 
-    def grade(self, answer: str, context: list[RetrievalResult]) -> GradingResult:
+    def grade(self, answer: str, context: list[RetrievalResultFast]) -> GradingResult:
         """
         Grade if answer is grounded in context.
 
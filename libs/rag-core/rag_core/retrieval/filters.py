@@ -1,11 +1,45 @@
 """Metadata filtering utilities and ACL hooks."""
 
+import functools
 import logging
 from typing import Any
 
+from rag_core.stores.filters import CompiledFilter
+
 logger = logging.getLogger(__name__)
 
 
+def _freeze(value: Any) -> Any:
+    """
+    Convert a filter value into a hashable cache key.
+
+    Dicts and lists become tagged tuples (recursively) and scalars are tagged
+    with their type: 1, 1.0 and True compare equal in Python but serialize to
+    different JSON, so they must not share a cache entry.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((k, _freeze(v)) for k, v in value.items())))
+    if isinstance(value, list | tuple):
+        return (list, tuple(_freeze(v) for v in value))
+    return (type(value), value)
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of _freeze (rebuilds dicts, lists and scalars) for JSON serialization."""
+    kind, inner = value
+    if kind is dict:
+        return {k: _thaw(v) for k, v in inner}
+    if kind is list:
+        return [_thaw(v) for v in inner]
+    return inner
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(frozen: Any) -> CompiledFilter:
+    """Compile a frozen filter dict (cached per filter shape)."""
+    return CompiledFilter.from_dict(_thaw(frozen))
+
+
 class MetadataFilter:
     """
     Build metadata filters for vector search.
@@ -81,3 +115,24 @@ class MetadataFilter:
             logger.info(f"ACL filtering for user {user_id} (not yet implemented)")
 
         return filters
+
+    @staticmethod
+    def compile_filters(filters: dict[str, Any]) -> CompiledFilter:
+        """
+        Compile a metadata filter dict into a cached CompiledFilter.
+
+        Recurring filter shapes (same user, same category) are serialized to
+        JSON once and reused across queries.
+
+        Args:
+            filters: Metadata filter dict (e.g., from build_filters())
+
+        Returns:
+            CompiledFilter accepted by PgVectorStore.similarity_search()
+
+        Example:
+            compiled = MetadataFilter.compile_filters(
+                MetadataFilter.build_filters(category="technical")
+            )
+        """
+        return _compile(_freeze(filters))
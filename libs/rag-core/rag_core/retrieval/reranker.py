@@ -2,7 +2,9 @@
 
 import logging
 
-from rag_core.schemas.models import RetrievalResult
+import numpy as np
+
+from rag_core.schemas.fast import RetrievalResultFast
 
 logger = logging.getLogger(__name__)
 
@@ -21,12 +23,27 @@ class Reranker:
         """
         Initialize reranker.
 
+        The strategy is resolved once here so rerank() is a direct call.
+
         Args:
-            strategy: Reranking strategy ("none", "recency", "metadata")
+            strategy: Reranking strategy ("none", "recency")
+
+        Raises:
+            ValueError: If strategy is unknown
         """
+        strategies = {
+            "none": self._identity,
+            "recency": self._rerank_by_recency,
+        }
+        if strategy not in strategies:
+            raise ValueError(
+                f"Unknown reranking strategy: {strategy}. Supported: {sorted(strategies)}"
+            )
+
         self.strategy = strategy
+        self._impl = strategies[strategy]
 
-    def rerank(self, results: list[RetrievalResult]) -> list[RetrievalResult]:
+    def rerank(self, results: list[RetrievalResultFast]) -> list[RetrievalResultFast]:
         """
         Rerank results based on strategy.
 
@@ -36,16 +53,14 @@ class Reranker:
         Returns:
             Reranked results (may have adjusted scores)
         """
-        if self.strategy == "none" or not results:
-            return results
-
-        if self.strategy == "recency":
-            return self._rerank_by_recency(results)
+        return self._impl(results)
 
-        logger.warning(f"Unknown reranking strategy: {self.strategy}")
+    @staticmethod
+    def _identity(results: list[RetrievalResultFast]) -> list[RetrievalResultFast]:
+        """Return results unchanged."""
         return results
 
-    def _rerank_by_recency(self, results: list[RetrievalResult]) -> list[RetrievalResult]:
+    def _rerank_by_recency(self, results: list[RetrievalResultFast]) -> list[RetrievalResultFast]:
         """
         Boost scores for more recent chunks.
 
@@ -54,31 +69,27 @@ class Reranker:
         if not results:
             return results
 
-        # Sort by creation date
-        sorted_results = sorted(
-            results,
-            key=lambda r: r.chunk.created_at,
-            reverse=True,  # Newest first
+        n = len(results)
+        created = np.fromiter(
+            (r.chunk.created_at.timestamp() for r in results), dtype=np.float64, count=n
         )
+        scores = np.fromiter((r.score for r in results), dtype=np.float64, count=n)
 
-        # Apply recency boost
-        n = len(sorted_results)
+        # Position by recency: 0 = newest (stable: equal timestamps keep retrieval order)
+        recency_pos = np.argsort(-created, kind="stable").argsort()
 
-        if n > 1:
-            for i, result in enumerate(sorted_results):
-                # Linearly scale from 1.0 (newest) to 0.9 (oldest), inclusive
-                recency_factor = 1.0 - (i / n) * 0.1  # 1.0 → 0.9
-                result.score *= recency_factor
-        else:
-            # Single result -> no change
-            sorted_results[0].score *= 1.0
+        # Linearly scale from 1.0 (newest) towards 0.9 (oldest)
+        adjusted = scores * (1.0 - recency_pos / n * 0.1)
 
-        # Re-sort by adjusted score
-        sorted_results.sort(key=lambda r: r.score, reverse=True)
+        # Sort by adjusted score, ties broken by recency
+        order = np.lexsort((recency_pos, -adjusted))
 
-        # Update ranks
-        for rank, result in enumerate(sorted_results, start=1):
+        reranked = []
+        for rank, idx in enumerate(order.tolist(), start=1):
+            result = results[idx]
+            result.score = float(adjusted[idx])
             result.rank = rank
+            reranked.append(result)
 
-        logger.debug(f"Reranked {len(results)} results by recency")
-        return sorted_results
+        logger.debug(f"Reranked {n} results by recency")
+        return reranked
@@ -3,7 +3,8 @@
 import logging
 from typing import Any
 
-from rag_core.schemas.models import RetrievalResult
+from rag_core.schemas.fast import RetrievalResultFast
+from rag_core.stores.filters import CompiledFilter
 from rag_core.stores.pgvector_store import PgVectorStore
 
 logger = logging.getLogger(__name__)
@@ -42,8 +43,8 @@ class Retriever:
         query_embedding: list[float],
         top_k: int | None = None,
         threshold: float | None = None,
-        filters: dict[str, Any] | None = None,
-    ) -> list[RetrievalResult]:
+        filters: dict[str, Any] | CompiledFilter | None = None,
+    ) -> list[RetrievalResultFast]:
         """
         Retrieve relevant chunks.
 
@@ -51,7 +52,7 @@ class Retriever:
             query_embedding: Query vector
             top_k: Number of results (uses default if None)
             threshold: Similarity threshold (uses default if None)
-            filters: Metadata filters
+            filters: Metadata filters (dict or CompiledFilter)
 
         Returns:
             List of retrieval results, ranked by similarity
@@ -70,3 +71,39 @@ class Retriever:
 
         logger.info(f"Retrieved {len(results)} chunks")
         return results
+
+    def retrieve_batch(
+        self,
+        query_embeddings: list[list[float]],
+        top_k: int | None = None,
+        threshold: float | None = None,
+        filters: dict[str, Any] | CompiledFilter | None = None,
+    ) -> list[list[RetrievalResultFast]]:
+        """
+        Retrieve relevant chunks for several queries in one database round-trip.
+
+        Args:
+            query_embeddings: Query vectors
+            top_k: Number of results per query (uses default if None)
+            threshold: Similarity threshold (uses default if None)
+            filters: Metadata filters applied to every query
+
+        Returns:
+            One list of retrieval results per query, ranked by similarity
+        """
+        k = top_k if top_k is not None else self.default_top_k
+        thresh = threshold if threshold is not None else self.default_threshold
+
+        logger.info(
+            f"Retrieving top-{k} chunks for {len(query_embeddings)} queries (threshold={thresh})"
+        )
+
+        results = self.store.similarity_search_batch(
+            query_embeddings=query_embeddings,
+            top_k=k,
+            filters=filters,
+            threshold=thresh,
+        )
+
+        logger.info(f"Retrieved {sum(len(r) for r in results)} chunks")
+        return results
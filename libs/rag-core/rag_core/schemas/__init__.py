@@ -1,17 +1,21 @@
 """Shared data models for RAG system."""
 
+from rag_core.schemas.fast import RetrievalResultFast
 from rag_core.schemas.models import (
     Chunk,
     Citation,
     Document,
     GradingResult,
     RetrievalResult,
+    batch_now,
 )
 
 __all__ = [
     "Chunk",
     "Document",
     "RetrievalResult",
+    "RetrievalResultFast",
     "Citation",
     "GradingResult",
+    "batch_now",
 ]
@@ -0,0 +1,33 @@
+"""Lightweight in-memory result types for hot retrieval paths."""
+
+from dataclasses import dataclass
+
+from rag_core.schemas.models import Chunk, RetrievalResult
+
+
+@dataclass(slots=True)
+class RetrievalResultFast:
+    """
+    Result from similarity search (hot-path variant of RetrievalResult).
+
+    A slotted dataclass: no validation on construction or attribute
+    assignment, so rerankers can adjust score/rank cheaply. Convert with
+    to_pydantic() when crossing an API/JSON boundary.
+    """
+
+    chunk: Chunk
+    score: float
+    rank: int
+
+    def to_pydantic(self) -> RetrievalResult:
+        """
+        Convert to the validated Pydantic model.
+
+        Score is clamped to [0, 1] to absorb floating-point drift from the
+        database distance computation.
+        """
+        return RetrievalResult(
+            chunk=self.chunk,
+            score=min(max(self.score, 0.0), 1.0),
+            rank=self.rank,
+        )
@@ -0,0 +1,24 @@
+"""String interning for repeated metadata keys and values."""
+
+import sys
+from typing import Any
+
+
+def intern_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
+    """
+    Intern top-level string keys and values of a metadata dict.
+
+    Chunks of the same document repeat keys like "source"/"page" and values
+    like the source filename; interning makes every chunk share one string
+    object instead of holding its own copy.
+
+    Args:
+        metadata: Metadata dict
+
+    Returns:
+        New dict with interned keys and string values
+    """
+    return {
+        (sys.intern(k) if type(k) is str else k): (sys.intern(v) if type(v) is str else v)
+        for k, v in metadata.items()
+    }
@@ -1,21 +1,125 @@
 """Pydantic models for RAG data structures."""
 
-from datetime import datetime
-from typing import Any
-from uuid import uuid4
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from functools import cached_property
+from typing import Annotated, Any, Self, cast
 
-from pydantic import BaseModel, Field, field_validator
+import numpy as np
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    WithJsonSchema,
+    computed_field,
+    field_serializer,
+    field_validator,
+)
 
 from rag_core.config import EMBEDDING_DIM
+from rag_core.schemas.intern import intern_metadata
+from rag_core.utils.ids import generate_id
+from rag_core.utils.text import token_bits
 
+# Timestamp shared by all models created inside a batch_now() block
+_BATCH_NOW: ContextVar[datetime | None] = ContextVar("_BATCH_NOW", default=None)
 
-class Chunk(BaseModel):
-    """A chunk of text with embeddings and metadata."""
 
-    id: str = Field(default_factory=lambda: f"chunk_{uuid4().hex[:12]}")
+@contextmanager
+def batch_now() -> Iterator[datetime]:
+    """
+    Share a single creation timestamp across models built in this block.
+
+    Bulk ingestion creates thousands of chunks at once; one timestamp per
+    batch avoids a clock read and datetime allocation per model.
+
+    Yields:
+        The shared UTC timestamp
+
+    Example:
+        with batch_now():
+            chunks = [Chunk(...) for piece in pieces]
+    """
+    now = datetime.now(UTC)
+    token = _BATCH_NOW.set(now)
+    try:
+        yield now
+    finally:
+        _BATCH_NOW.reset(token)
+
+
+def _utcnow() -> datetime:
+    """Current UTC time (or the shared batch_now() timestamp)."""
+    return _BATCH_NOW.get() or datetime.now(UTC)
+
+
+# Embeddings are held as contiguous float32 arrays (serialized as lists in JSON).
+# Annotated as Any so callers may pass lists or arrays; the validator normalizes.
+Embedding = Annotated[
+    Any,
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
+
+_CHUNK_EXAMPLE: dict[str, Any] = {
+    "id": "chunk_abc123",
+    "document_id": "doc_xyz789",
+    "text": "This is an example chunk of text.",
+    "embedding": [0.1] * 1536,
+    "metadata": {"source": "manual.pdf", "page": 5},
+    "chunk_index": 0,
+}
+
+
+def _as_float32(v: Any) -> np.ndarray:
+    """
+    Embedding as a read-only, C-contiguous float32 array.
+
+    Strided views (e.g., a column of a matrix) are packed so BLAS and the
+    pgvector dumper read one block. A writeable array still shared with the
+    caller is copied, so later writes to it can't change the (frozen) chunk;
+    read-only float32 arrays are used as-is.
+    """
+    if hasattr(v, "to_numpy"):  # pgvector Vector / HalfVector
+        v = v.to_numpy()
+    arr = np.ascontiguousarray(v, dtype=np.float32)
+    if arr.flags.writeable:
+        if isinstance(v, np.ndarray) and np.may_share_memory(arr, v):
+            arr = arr.copy()
+        arr.flags.writeable = False
+    return arr
+
+
+class _CachingModel(BaseModel):
+    """Base for models caching values derived from fields (cached_property)."""
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the model, dropping cached values (they may be stale after update)."""
+        copy = super().model_copy(update=update, deep=deep)
+        for name in copy.__dict__.keys() - type(self).model_fields.keys():
+            del copy.__dict__[name]
+        return copy
+
+
+class Chunk(_CachingModel):
+    """
+    A chunk of text with embeddings and metadata.
+
+    Models are frozen and the embedding array is read-only (writeable input
+    arrays are copied), so instances can be shared by caches without
+    defensive copies (use model_copy(update=...) to derive a modified one).
+    Chunks hash by id.
+
+    Chunks returned by similarity search carry embedding=None unless the
+    search was run with return_embedding=True.
+    """
+
+    id: str = Field(default_factory=lambda: generate_id("chunk"))
     document_id: str = Field(..., description="Parent document ID")
     text: str = Field(..., min_length=1, description="Chunk text content")
-    embedding: list[float] = Field(..., description=f"Vector embedding ({EMBEDDING_DIM}-dim)")
+    embedding: Embedding = Field(..., description=f"Vector embedding ({EMBEDDING_DIM}-dim)")
     metadata: dict[str, Any] = Field(default_factory=dict, description="Arbitrary metadata")
 
     # Positioning
@@ -24,52 +128,122 @@ class Chunk(BaseModel):
     end_char: int | None = Field(None, ge=0, description="End character position")
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
-    @field_validator("embedding")
+    @field_validator("embedding", mode="before")
     @classmethod
-    def validate_embedding_dimension(cls, v: list[float]) -> list[float]:
-        """Ensure embedding matches configured dimension."""
-        if len(v) != EMBEDDING_DIM:
-            raise ValueError(f"Expected {EMBEDDING_DIM}-dim embedding, got {len(v)}")
-        return v
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": "chunk_abc123",
-                "document_id": "doc_xyz789",
-                "text": "This is an example chunk of text.",
-                "embedding": [0.1] * 1536,
-                "metadata": {"source": "manual.pdf", "page": 5},
-                "chunk_index": 0,
-            }
-        }
+    def validate_embedding_dimension(cls, v: Any) -> np.ndarray:
+        """
+        Coerce embedding to a float32 array and check its dimension.
+
+        Accepts lists, NumPy arrays and pgvector values; float32 arrays of the
+        right shape are used as-is (no per-element validation or copy).
+        """
+        try:
+            arr = _as_float32(v)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid embedding: {e}") from e
+
+        if arr.shape != (EMBEDDING_DIM,):
+            got = arr.shape[0] if arr.ndim == 1 else arr.shape
+            raise ValueError(f"Expected {EMBEDDING_DIM}-dim embedding, got {got}")
+        return arr
+
+    @field_validator("metadata")
+    @classmethod
+    def intern_metadata_strings(cls, v: dict[str, Any]) -> dict[str, Any]:
+        """Share repeated metadata key/value strings across chunks."""
+        return intern_metadata(v)
+
+    @classmethod
+    def from_trusted(cls, **fields: Any) -> "Chunk":
+        """
+        Build a chunk from trusted fields without Pydantic validation.
+
+        For internal producers whose data is already valid (embedding
+        pipeline output, DB rows, cache entries). Defaults such as id and
+        timestamps are filled in as usual and the embedding (if any) is
+        coerced to float32, but nothing is checked: use Chunk(...) for
+        untrusted input such as API bodies.
+        """
+        embedding = fields.get("embedding")
+        if embedding is not None:
+            fields["embedding"] = _as_float32(embedding)
+        return cls.model_construct(**fields)
+
+    @classmethod
+    def bulk_validate(cls, rows: list[dict[str, Any]]) -> list["Chunk"]:
+        """
+        Validate many chunks in a single pydantic-core call.
+
+        Same checks as Chunk(**row) per row, but the whole list crosses into
+        the Rust validator once instead of once per chunk. Use for untrusted
+        batches (e.g., ingestion input); see from_trusted() for trusted data.
+
+        Raises:
+            ValidationError: If any row is invalid (errors are indexed by row)
+        """
+        return _CHUNK_LIST_ADAPTER.validate_python(rows)
+
+    @field_serializer("embedding", when_used="json")
+    def serialize_embedding(self, v: np.ndarray | None) -> list[float] | None:
+        """Emit embedding as a plain list at JSON boundaries."""
+        return None if v is None else cast(list[float], v.tolist())
+
+    @cached_property
+    def token_set(self) -> frozenset[str]:
+        """Lowercased whitespace tokens of text (computed once, not serialized)."""
+        return frozenset(self.text.lower().split())
+
+    @cached_property
+    def token_bits(self) -> int:
+        """Bitset of token_set (see rag_core.utils.text.token_bits(); computed once)."""
+        return token_bits(self.token_set)
+
+    def __hash__(self) -> int:
+        """Hash by id (the embedding array is unhashable; equal chunks share an id)."""
+        return hash(self.id)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare chunks field by field (embeddings compared element-wise)."""
+        if not isinstance(other, Chunk):
+            return NotImplemented
+        return self.model_dump(exclude={"embedding"}) == other.model_dump(
+            exclude={"embedding"}
+        ) and np.array_equal(self.embedding, other.embedding)
+
+    model_config = ConfigDict(frozen=True, json_schema_extra={"example": _CHUNK_EXAMPLE})
+
+
+# Built once: validator for Chunk.bulk_validate()
+_CHUNK_LIST_ADAPTER = TypeAdapter(list[Chunk])
 
 
 class Document(BaseModel):
     """A source document (e.g., PDF, webpage)."""
 
-    id: str = Field(default_factory=lambda: f"doc_{uuid4().hex[:12]}")
+    id: str = Field(default_factory=lambda: generate_id("doc"))
     title: str = Field(..., min_length=1)
     source_uri: str = Field(..., description="Original location (file path, URL, etc.)")
     content: str | None = Field(None, description="Full text content (optional)")
     metadata: dict[str, Any] = Field(default_factory=dict)
 
     # Timestamps
-    ingested_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    ingested_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "id": "doc_xyz789",
                 "title": "Aeroknite Drone Manual",
                 "source_uri": "s3://aeroknite-docs/manual.pdf",
                 "metadata": {"category": "technical", "version": "2.0"},
             }
-        }
+        },
+    )
 
 
 class RetrievalResult(BaseModel):
@@ -79,17 +253,19 @@ class RetrievalResult(BaseModel):
     score: float = Field(..., ge=0.0, le=1.0, description="Similarity score (0-1)")
     rank: int = Field(..., ge=1, description="Rank in results (1-indexed)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
-                "chunk": Chunk.Config.json_schema_extra["example"],
+                "chunk": _CHUNK_EXAMPLE,
                 "score": 0.85,
                 "rank": 1,
             }
-        }
+        },
+    )
 
 
-class Citation(BaseModel):
+class Citation(_CachingModel):
     """Citation referencing a source chunk."""
 
     chunk_id: str
@@ -98,12 +274,19 @@ class Citation(BaseModel):
     score: float = Field(..., ge=0.0, le=1.0)
     metadata: dict[str, Any] = Field(default_factory=dict)
 
-    def format(self) -> str:
-        """Format citation for display."""
-        source = self.metadata.get("source", "Unknown")
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def formatted(self) -> str:
+        """Display string (computed once per citation)."""
         page = self.metadata.get("page")
         page_str = f", page {page}" if page else ""
-        return f"[{source}{page_str}]: {self.text[:100]}..."
+        return f"[{self.metadata.get('source', 'Unknown')}{page_str}]: {self.text[:100]}..."
+
+    def format(self) -> str:
+        """Format citation for display."""
+        return self.formatted
+
+    model_config = ConfigDict(frozen=True)
 
 
 class GradingResult(BaseModel):
@@ -113,3 +296,5 @@ class GradingResult(BaseModel):
     score: float = Field(..., ge=0.0, le=1.0, description="Confidence score")
     reason: str | None = Field(None, description="Explanation for grade")
     metadata: dict[str, Any] = Field(default_factory=dict)
+
+    model_config = ConfigDict(frozen=True)
@@ -1,9 +1,13 @@
 """Vector store implementations."""
 
+from rag_core.stores.cache import ProximityCache
+from rag_core.stores.filters import CompiledFilter
 from rag_core.stores.migrations import ensure_schema
 from rag_core.stores.pgvector_store import PgVectorStore
 
 __all__ = [
     "PgVectorStore",
+    "CompiledFilter",
+    "ProximityCache",
     "ensure_schema",
 ]
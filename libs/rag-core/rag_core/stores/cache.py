@@ -0,0 +1,135 @@
+"""Approximate (proximity) cache for similarity search results."""
+
+import logging
+import threading
+from typing import Any
+
+import numpy as np
+
+from rag_core.config import EMBEDDING_DIM
+from rag_core.schemas.fast import RetrievalResultFast
+
+logger = logging.getLogger(__name__)
+
+
+class ProximityCache:
+    """
+    LRU cache of search results keyed by query embedding.
+
+    A lookup hits when the cosine distance between the query and the nearest
+    cached query is within tau, so repeated and near-duplicate queries skip the
+    database entirely. All keys are compared with a single matrix-vector
+    product.
+
+    Results are approximate by design: a hit returns the cached query's
+    top-k (and scores) as-is. Thread-safe (a pooled store searches from
+    several threads).
+    """
+
+    def __init__(self, capacity: int = 256, tau: float = 0.01):
+        """
+        Initialize cache.
+
+        Args:
+            capacity: Maximum number of cached queries
+            tau: Maximum cosine distance (0-2) for a cache hit
+
+        Raises:
+            ValueError: If capacity < 1 or tau < 0
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        if tau < 0:
+            raise ValueError(f"tau must be >= 0, got {tau}")
+
+        self.capacity = capacity
+        self.tau = tau
+
+        # Unit-length query keys; rows are overwritten in place on eviction
+        self._keys = np.zeros((capacity, EMBEDDING_DIM), dtype=np.float32)
+        self._values: list[tuple[int, list[RetrievalResultFast]]] = []
+        self._last_used = np.zeros(capacity, dtype=np.int64)
+        self._clock = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of cached queries."""
+        return len(self._values)
+
+    def get(self, query_embedding: Any, top_k: int) -> list[RetrievalResultFast] | None:
+        """
+        Look up results for a query.
+
+        Args:
+            query_embedding: Query vector (EMBEDDING_DIM-dimensional)
+            top_k: Number of results requested
+
+        Returns:
+            Cached results (fresh objects, safe to mutate), or None on a miss
+        """
+        query = self._normalize(query_embedding)
+        if query is None:
+            return None
+
+        with self._lock:
+            if not self._values:
+                return None
+
+            sims = self._keys[: len(self._values)] @ query
+            slot = int(np.argmax(sims))
+            if 1.0 - float(sims[slot]) > self.tau:
+                return None
+
+            cached_top_k, results = self._values[slot]
+            if cached_top_k < top_k:
+                return None  # Cached entry may be missing results ranked below its top_k
+
+            self._touch(slot)
+        return [RetrievalResultFast(r.chunk, r.score, r.rank) for r in results[:top_k]]
+
+    def put(self, query_embedding: Any, top_k: int, results: list[RetrievalResultFast]) -> None:
+        """
+        Cache results for a query, evicting the least recently used entry if full.
+
+        Args:
+            query_embedding: Query vector (EMBEDDING_DIM-dimensional)
+            top_k: Number of results that were requested
+            results: Search results for the query
+        """
+        query = self._normalize(query_embedding)
+        if query is None:
+            return
+
+        entry = (top_k, [RetrievalResultFast(r.chunk, r.score, r.rank) for r in results])
+        with self._lock:
+            if len(self._values) < self.capacity:
+                slot = len(self._values)
+                self._values.append(entry)
+            else:
+                slot = int(np.argmin(self._last_used))
+                self._values[slot] = entry
+
+            self._keys[slot] = query
+            self._touch(slot)
+
+    def clear(self) -> None:
+        """Drop all cached results (e.g., after the underlying data changed)."""
+        with self._lock:
+            if self._values:
+                logger.debug(f"Clearing proximity cache ({len(self._values)} entries)")
+            self._values.clear()
+            self._last_used[:] = 0
+
+    def _touch(self, slot: int) -> None:
+        """Mark a slot as most recently used (caller holds the lock)."""
+        self._clock += 1
+        self._last_used[slot] = self._clock
+
+    @staticmethod
+    def _normalize(embedding: Any) -> np.ndarray | None:
+        """Return the unit-length float32 query, or None for a zero vector."""
+        query = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return None
+        return query / norm
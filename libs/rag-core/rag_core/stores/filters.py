@@ -0,0 +1,30 @@
+"""Pre-compiled metadata filters for pgvector queries."""
+
+import json
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledFilter:
+    """
+    Metadata filter pre-serialized for PgVectorStore.similarity_search().
+
+    Holds one JSONB containment document covering every filter key, so a
+    filter reused across queries is serialized once instead of per query.
+    """
+
+    filters_json: str
+
+    @classmethod
+    def from_dict(cls, filters: dict[str, Any]) -> "CompiledFilter":
+        """
+        Compile a metadata filter dict.
+
+        Args:
+            filters: Metadata filters (e.g., {"category": "technical"})
+
+        Returns:
+            Compiled filter
+        """
+        return cls(filters_json=json.dumps(filters, sort_keys=True))
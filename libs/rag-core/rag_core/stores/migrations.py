@@ -5,27 +5,106 @@ from typing import Any
 
 import psycopg
 from psycopg import sql
+from psycopg.rows import tuple_row
 
-from rag_core.config import EMBEDDING_DIM
+from rag_core.config import EMBEDDING_DIM, EMBEDDING_PRECISION, NORMALIZE_EMBEDDINGS
 
 logger = logging.getLogger(__name__)
 
+# halfvec (FP16 storage, half the memory of vector) requires pgvector >= 0.7.0
+HALFVEC_MIN_VERSION = (0, 7, 0)
 
-def ensure_schema(conn: psycopg.Connection[Any]) -> None:
+
+def _parse_version(version: str) -> tuple[int, ...]:
+    """Parse an extension version string (e.g., "0.7.4") into a tuple."""
+    return tuple(int(part) for part in version.split(".") if part.isdigit())
+
+
+def embedding_column_type(conn: psycopg.Connection[Any]) -> str | None:
+    """
+    Look up the storage type of chunks.embedding.
+
+    Args:
+        conn: Active Postgres connection
+
+    Returns:
+        "vector" or "halfvec", or None if the chunks table does not exist
+    """
+    with conn.cursor(row_factory=tuple_row) as cur:
+        cur.execute("""
+            SELECT t.typname
+            FROM pg_attribute a
+            JOIN pg_type t ON t.oid = a.atttypid
+            WHERE a.attrelid = to_regclass('chunks') AND a.attname = 'embedding';
+        """)
+        row = cur.fetchone()
+    return str(row[0]) if row else None
+
+
+def _index_opclass(conn: psycopg.Connection[Any], index_name: str) -> str | None:
+    """Operator class of an index's first column, or None if the index does not exist."""
+    with conn.cursor(row_factory=tuple_row) as cur:
+        cur.execute(
+            """
+            SELECT opc.opcname
+            FROM pg_index i
+            JOIN pg_opclass opc ON opc.oid = i.indclass[0]
+            WHERE i.indexrelid = to_regclass(%s);
+            """,
+            (index_name,),
+        )
+        row = cur.fetchone()
+    return str(row[0]) if row else None
+
+
+def _has_unnormalized_embeddings(conn: psycopg.Connection[Any], column_type: str) -> bool:
+    """Whether any stored embedding is not unit-length (stops at the first one)."""
+    norm_fn = "l2_norm" if column_type == "halfvec" else "vector_norm"
+    with conn.cursor(row_factory=tuple_row) as cur:
+        # Tolerance covers FP16 rounding of halfvec components
+        cur.execute(sql.SQL("""
+                SELECT EXISTS (
+                    SELECT 1 FROM chunks WHERE abs({norm_fn}(embedding) - 1) > 1e-2
+                );
+            """).format(norm_fn=sql.Identifier(norm_fn)))
+        row = cur.fetchone()
+    return bool(row and row[0])
+
+
+def ensure_schema(
+    conn: psycopg.Connection[Any],
+    maintenance_work_mem: str | None = None,
+    max_parallel_maintenance_workers: int | None = None,
+    hnsw_m: int = 16,
+    hnsw_ef_construction: int = 64,
+) -> None:
     """
     Ensure pgvector extension and required tables exist.
 
     REQUIREMENTS:
     - Postgres >= 16
-    - pgvector >= 0.7.0 (for HNSW index support)
+    - pgvector >= 0.7.0 (for HNSW index support and halfvec storage)
+
+    With EMBEDDING_PRECISION="half" (default) embeddings are stored as halfvec
+    (FP16) when pgvector supports it, vector (FP32) otherwise; "full" always
+    uses vector. Existing tables keep their column type.
 
     This is idempotent and safe to call on every startup.
 
     Args:
         conn: Active Postgres connection
+        maintenance_work_mem: Optional memory budget for the vector index build
+            (e.g., "2GB"); HNSW builds much faster when the graph fits in memory
+        max_parallel_maintenance_workers: Optional worker count for parallel
+            index builds (pgvector >= 0.6.0)
+        hnsw_m: HNSW max connections per node (pgvector default: 16)
+        hnsw_ef_construction: HNSW build candidate list size (pgvector
+            default: 64; higher = better recall, slower build)
 
     Raises:
         psycopg.Error: If schema creation fails
+        RuntimeError: If NORMALIZE_EMBEDDINGS is on but existing chunks hold
+            non-unit-length embeddings (inner-product scores would be wrong)
     """
     logger.info(f"Ensuring pgvector schema (embedding_dim={EMBEDDING_DIM})...")
 
@@ -39,6 +118,11 @@ def ensure_schema(conn: psycopg.Connection[Any]) -> None:
         version = cur.fetchone()
         if version:
             logger.info(f"pgvector version: {version[0]}")
+        use_halfvec = EMBEDDING_PRECISION == "half"
+        if use_halfvec and (version is None or _parse_version(version[0]) < HALFVEC_MIN_VERSION):
+            logger.warning("halfvec requires pgvector >= 0.7.0, storing full-precision vectors")
+            use_halfvec = False
+        column_type = "halfvec" if use_halfvec else "vector"
 
         # 2. Create documents table
         logger.info("Creating documents table...")
@@ -55,7 +139,7 @@ def ensure_schema(conn: psycopg.Connection[Any]) -> None:
         """)
 
         # 3. Create chunks table with dynamic embedding dimension
-        logger.info(f"Creating chunks table (vector({EMBEDDING_DIM}))...")
+        logger.info(f"Creating chunks table ({column_type}({EMBEDDING_DIM}))...")
 
         # Construct SQL with embedding dimension (safe: EMBEDDING_DIM is validated int)
         dim_sql = sql.SQL(str(EMBEDDING_DIM))
@@ -65,7 +149,7 @@ def ensure_schema(conn: psycopg.Connection[Any]) -> None:
                     id TEXT PRIMARY KEY,
                     document_id TEXT NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
                     text TEXT NOT NULL,
-                    embedding vector({dim}) NOT NULL,
+                    embedding {column_type}({dim}) NOT NULL,
                     metadata JSONB DEFAULT '{{}}',
                     chunk_index INTEGER NOT NULL DEFAULT 0,
                     start_char INTEGER,
@@ -73,7 +157,14 @@ def ensure_schema(conn: psycopg.Connection[Any]) -> None:
                     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
                     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
                 );
-            """).format(dim=dim_sql))
+            """).format(column_type=sql.SQL(column_type), dim=dim_sql))
+
+        # Index opclass must match the actual column (table may predate halfvec)
+        column_type = embedding_column_type(conn) or column_type
+        # Normalized embeddings are indexed by inner product (no per-candidate norms)
+        metric = "ip" if NORMALIZE_EMBEDDINGS else "cosine"
+        ops = f"{column_type}_{metric}_ops"
+        ops_sql = sql.SQL(ops)
 
         # 4. Create indexes for performance
         logger.info("Creating indexes...")
@@ -83,13 +174,47 @@ def ensure_schema(conn: psycopg.Connection[Any]) -> None:
         # Fall back to IVFFlat if HNSW unavailable
         logger.info("Creating vector similarity index...")
 
+        # An index built for the other metric (NORMALIZE_EMBEDDINGS changed, or a
+        # schema that predates it) cannot serve the search operator: rebuild it
+        for index_name in ("chunks_embedding_hnsw_idx", "chunks_embedding_ivfflat_idx"):
+            existing_ops = _index_opclass(conn, index_name)
+            if existing_ops is not None and existing_ops != ops:
+                if metric == "ip" and _has_unnormalized_embeddings(conn, column_type):
+                    raise RuntimeError(
+                        f"Refusing to rebuild {index_name} for inner product: chunks "
+                        "contains embeddings that are not unit-length, so <#> scores "
+                        "would not be cosine similarities. Re-ingest the chunks (or "
+                        "normalize them in SQL), or set RAG_NORMALIZE_EMBEDDINGS=0 "
+                        "to keep the cosine index."
+                    )
+                logger.warning(f"Rebuilding {index_name} ({existing_ops} -> {ops})")
+                cur.execute(sql.SQL("DROP INDEX {};").format(sql.Identifier(index_name)))
+
+        # Build settings are transaction-local (reset on commit)
+        if maintenance_work_mem is not None:
+            cur.execute(
+                "SELECT set_config('maintenance_work_mem', %s, true);", (maintenance_work_mem,)
+            )
+        if max_parallel_maintenance_workers is not None:
+            cur.execute(
+                "SELECT set_config('max_parallel_maintenance_workers', %s, true);",
+                (str(max_parallel_maintenance_workers),),
+            )
+
         cur.execute("SAVEPOINT create_vector_index;")
         try:
             logger.info("Creating HNSW index (optimal for <1M vectors)...")
-            cur.execute("""
-                CREATE INDEX IF NOT EXISTS chunks_embedding_hnsw_idx
-                ON chunks USING hnsw (embedding vector_cosine_ops);
-            """)
+            cur.execute(
+                sql.SQL("""
+                    CREATE INDEX IF NOT EXISTS chunks_embedding_hnsw_idx
+                    ON chunks USING hnsw (embedding {ops})
+                    WITH (m = {m}, ef_construction = {ef_construction});
+                """).format(
+                    ops=ops_sql,
+                    m=sql.Literal(hnsw_m),
+                    ef_construction=sql.Literal(hnsw_ef_construction),
+                )
+            )
             logger.info("✓ HNSW index created")
             cur.execute("RELEASE SAVEPOINT create_vector_index;")
         except psycopg.Error as e:
@@ -99,30 +224,37 @@ def ensure_schema(conn: psycopg.Connection[Any]) -> None:
             cur.execute("ROLLBACK TO SAVEPOINT create_vector_index;")
             cur.execute("RELEASE SAVEPOINT create_vector_index;")
 
+            cur.execute(sql.SQL("""
+                    CREATE INDEX IF NOT EXISTS chunks_embedding_ivfflat_idx
+                    ON chunks USING ivfflat (embedding {ops})
+                    WITH (lists = 100);
+                """).format(ops=ops_sql))
+            logger.info("✓ IVFFlat index created (fallback)")
+
+        # Secondary indexes are independent: send them in one pipelined exchange
+        with conn.pipeline():
+            # Document foreign key index
             cur.execute("""
-                CREATE INDEX IF NOT EXISTS chunks_embedding_ivfflat_idx
-                ON chunks USING ivfflat (embedding vector_cosine_ops)
-                WITH (lists = 100);
+                CREATE INDEX IF NOT EXISTS chunks_document_id_idx
+                ON chunks(document_id);
             """)
-            logger.info("✓ IVFFlat index created (fallback)")
 
-        # Document foreign key index
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS chunks_document_id_idx
-            ON chunks(document_id);
-        """)
+            # Metadata JSONB index: jsonb_path_ops only supports @> (all filters
+            # use containment) and is smaller and faster than the default opclass
+            cur.execute("DROP INDEX IF EXISTS chunks_metadata_idx;")
+            cur.execute("""
+                CREATE INDEX IF NOT EXISTS chunks_metadata_gin_idx
+                ON chunks USING gin (metadata jsonb_path_ops);
+            """)
 
-        # Metadata JSONB index (GIN for fast JSON queries)
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS chunks_metadata_idx
-            ON chunks USING gin (metadata);
-        """)
+            # Timestamp indexes for time-based queries
+            cur.execute("""
+                CREATE INDEX IF NOT EXISTS chunks_created_at_idx
+                ON chunks(created_at);
+            """)
 
-        # Timestamp indexes for time-based queries
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS chunks_created_at_idx
-            ON chunks(created_at);
-        """)
+        # Refresh planner statistics so the first searches get accurate plans
+        cur.execute("ANALYZE documents, chunks;")
 
     conn.commit()
     logger.info("✓ Schema initialization complete")
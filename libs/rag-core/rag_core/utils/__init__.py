@@ -7,12 +7,13 @@ Stage 3 hermetic rule:
 """
 
 from rag_core.utils.ids import generate_id
-from rag_core.utils.retry import retry_with_backoff
+from rag_core.utils.retry import retry_with_backoff, retry_with_backoff_async
 
 # Text utilities with tiktoken dependency available via explicit import:
-# from rag_core.utils.text import clean_text, count_tokens, truncate_text
+# from rag_core.utils.text import clean_text, count_tokens, count_tokens_batch, truncate_text
 
 __all__ = [
     "generate_id",
     "retry_with_backoff",
+    "retry_with_backoff_async",
 ]
@@ -1,6 +1,6 @@
 """ID generation utilities."""
 
-from uuid import uuid4
+import secrets
 
 
 def generate_id(prefix: str = "") -> str:
@@ -17,5 +17,6 @@ def generate_id(prefix: str = "") -> str:
         >>> generate_id("chunk")
         "chunk_a1b2c3d4e5f6"
     """
-    suffix = uuid4().hex[:12]
+    # 12 hex chars straight from 6 random bytes (no UUID object / 32-char hex)
+    suffix = secrets.token_hex(6)
     return f"{prefix}_{suffix}" if prefix else suffix
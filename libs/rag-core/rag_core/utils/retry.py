@@ -1,21 +1,69 @@
 """Retry logic with exponential backoff."""
 
+import asyncio
 import functools
 import logging
+import random
 import time
-from collections.abc import Callable
-from typing import Any, TypeVar
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any, Literal, TypeVar
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+Jitter = Literal["none", "full", "decorrelated"]
+
+
+def _delays(
+    initial_delay: float,
+    backoff_factor: float,
+    max_delay: float,
+    jitter: Jitter,
+) -> Iterator[float]:
+    """
+    Yield successive sleep durations.
+
+    - "none": initial_delay * backoff_factor**n (capped at max_delay)
+    - "full": uniform(0, exponential delay), same growth as "none"
+    - "decorrelated": min(max_delay, uniform(initial_delay, previous_sleep * 3))
+      (AWS "decorrelated jitter"; ignores backoff_factor, so opt-in only)
+
+    Jitter spreads retries from concurrent workers so they don't hit a
+    recovering backend in lockstep.
+    """
+    delay = initial_delay
+    sleep = initial_delay
+    while True:
+        if jitter == "decorrelated":
+            sleep = min(max_delay, random.uniform(initial_delay, sleep * 3))
+            yield sleep
+            continue
+
+        capped = min(max_delay, delay)
+        yield random.uniform(0, capped) if jitter == "full" else capped
+        delay *= backoff_factor
+
+
+def _give_up(name: str, attempt: int, max_retries: int, sleep: float, deadline: float) -> bool:
+    """Log and decide whether to stop retrying (attempts or time budget exhausted)."""
+    if attempt == max_retries:
+        logger.error(f"Max retries ({max_retries}) exceeded for {name}")
+        return True
+    if time.monotonic() + sleep > deadline:
+        logger.error(f"Retry time budget exceeded for {name} after {attempt} attempts")
+        return True
+    return False
+
 
 def retry_with_backoff(
     max_retries: int = 3,
     initial_delay: float = 1.0,
     backoff_factor: float = 2.0,
     exceptions: tuple[type[Exception], ...] = (Exception,),
+    max_delay: float = float("inf"),
+    jitter: Jitter = "none",
+    max_total_time: float | None = None,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     Decorator for retrying functions with exponential backoff.
@@ -25,6 +73,12 @@ def retry_with_backoff(
         initial_delay: Initial delay in seconds
         backoff_factor: Multiplier for each retry
         exceptions: Tuple of exceptions to catch
+        max_delay: Upper bound for a single delay in seconds (default: uncapped)
+        jitter: Randomization strategy: "none" (default, plain exponential),
+            "full" (uniform up to the exponential delay) or "decorrelated"
+            (grows by up to 3x per retry; backoff_factor is ignored)
+        max_total_time: Optional wall-time budget in seconds; gives up early
+            instead of sleeping past it
 
     Returns:
         Decorator function
@@ -39,22 +93,24 @@ def retry_with_backoff(
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)  # ✅ Preserve function metadata
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            delay = initial_delay
+            deadline = (
+                time.monotonic() + max_total_time if max_total_time is not None else float("inf")
+            )
+            delays = _delays(initial_delay, backoff_factor, max_delay, jitter)
 
             for attempt in range(1, max_retries + 1):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    if attempt == max_retries:
-                        logger.error(f"Max retries ({max_retries}) exceeded for {func.__name__}")
+                    sleep = next(delays)
+                    if _give_up(func.__name__, attempt, max_retries, sleep, deadline):
                         raise
 
                     logger.warning(
                         f"Attempt {attempt}/{max_retries} failed for {func.__name__}: {e}. "
-                        f"Retrying in {delay}s..."
+                        f"Retrying in {sleep:.2f}s..."
                     )
-                    time.sleep(delay)
-                    delay *= backoff_factor
+                    time.sleep(sleep)
 
             # Should never reach here, but makes type checker happy
             raise RuntimeError("Retry logic error")
@@ -62,3 +118,53 @@ def retry_with_backoff(
         return wrapper
 
     return decorator
+
+
+def retry_with_backoff_async(
+    max_retries: int = 3,
+    initial_delay: float = 1.0,
+    backoff_factor: float = 2.0,
+    exceptions: tuple[type[Exception], ...] = (Exception,),
+    max_delay: float = float("inf"),
+    jitter: Jitter = "none",
+    max_total_time: float | None = None,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Decorator for retrying coroutine functions with exponential backoff.
+
+    Same options as retry_with_backoff(), but waits with asyncio.sleep() so
+    retries don't block the event loop.
+
+    Example:
+        @retry_with_backoff_async(max_retries=3, initial_delay=1.0)
+        async def fetch_data():
+            ...
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            deadline = (
+                time.monotonic() + max_total_time if max_total_time is not None else float("inf")
+            )
+            delays = _delays(initial_delay, backoff_factor, max_delay, jitter)
+
+            for attempt in range(1, max_retries + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except exceptions as e:
+                    sleep = next(delays)
+                    if _give_up(func.__name__, attempt, max_retries, sleep, deadline):
+                        raise
+
+                    logger.warning(
+                        f"Attempt {attempt}/{max_retries} failed for {func.__name__}: {e}. "
+                        f"Retrying in {sleep:.2f}s..."
+                    )
+                    await asyncio.sleep(sleep)
+
+            raise RuntimeError("Retry logic error")
+
+        return wrapper
+
+    return decorator
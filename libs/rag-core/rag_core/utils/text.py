@@ -4,30 +4,140 @@ NOTE: Token counting functions require tiktoken (optional dependency).
 Install with: pip install -e 'libs/rag-core[llm]'
 """
 
+import functools
+import os
 import re
-from typing import cast
+import zlib
+from collections.abc import Iterable
+from typing import Any, cast
+
+import numpy as np
+
+# Compiled once at import (regex fallback when numba is not installed)
+_MULTI_NEWLINE = re.compile(r"\n{3,}")
+_MULTI_SPACE = re.compile(r" {2,}")
+
+# clean_text() results are memoized for inputs up to this length (passages
+# recur across queries); longer texts bypass the cache so it can't pin them
+_CLEAN_CACHE_MAX_CHARS = 16_384
+
+_SPACE = ord(" ")
+_NEWLINE = ord("\n")
+
+
+def _collapse_whitespace(buf: Any, out: Any) -> int:
+    """
+    Copy UTF-8 bytes from buf to out, collapsing runs of spaces to one and
+    runs of 3+ newlines to two, in a single pass.
+
+    Space and newline bytes never occur inside multi-byte UTF-8 sequences, so
+    working on bytes is safe. Compiled with numba when available (see
+    _get_numba_collapse()); this plain-Python body is the reference version.
+
+    Returns:
+        Number of bytes written to out
+    """
+    n = 0
+    spaces = 0
+    newlines = 0
+    for b in buf:
+        if b == _SPACE:
+            spaces += 1
+            newlines = 0
+            if spaces > 1:
+                continue
+        elif b == _NEWLINE:
+            newlines += 1
+            spaces = 0
+            if newlines > 2:
+                continue
+        else:
+            spaces = 0
+            newlines = 0
+        out[n] = b
+        n += 1
+    return n
+
+
+@functools.cache
+def _get_numba_collapse() -> Any:
+    """JIT-compile _collapse_whitespace with numba (returns None if not installed)."""
+    try:
+        import numba
+    except ModuleNotFoundError:
+        return None
+    # cache=True keeps the compiled kernel on disk across processes
+    return numba.njit(cache=True, nogil=True)(_collapse_whitespace)
 
 
 def clean_text(text: str) -> str:
     """
     Clean text by removing extra whitespace and normalizing.
 
+    Uses a single-pass numba kernel when numba is installed ([perf] extras),
+    compiled regexes otherwise. Results for texts up to 16K characters are
+    cached (LRU, 4096 entries), so passages retrieved again and again are
+    cleaned once.
+
     Args:
         text: Raw text
 
     Returns:
         Cleaned text
     """
+    if len(text) > _CLEAN_CACHE_MAX_CHARS:
+        return _clean_text(text)
+    return _clean_text_cached(text)
+
+
+def _clean_text(text: str) -> str:
+    """Uncached clean_text() implementation."""
+    # Substring probes skip all work for already-clean text
+    has_newlines = "\n\n\n" in text
+    has_spaces = "  " in text
+    if not (has_newlines or has_spaces):
+        return text.strip()
+
+    collapse = _get_numba_collapse()
+    if collapse is not None:
+        # surrogatepass: lone surrogates (valid in str) round-trip like the regex path
+        buf = np.frombuffer(text.encode("utf-8", "surrogatepass"), dtype=np.uint8)
+        out = np.empty_like(buf)
+        n = collapse(buf, out)
+        return out[:n].tobytes().decode("utf-8", "surrogatepass").strip()
+
     # Remove multiple newlines
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    if has_newlines:
+        text = _MULTI_NEWLINE.sub("\n\n", text)
 
     # Remove multiple spaces
-    text = re.sub(r" {2,}", " ", text)
+    if has_spaces:
+        text = _MULTI_SPACE.sub(" ", text)
 
     # Strip leading/trailing whitespace
-    text = text.strip()
+    return text.strip()
+
+
+_clean_text_cached = functools.lru_cache(maxsize=4096)(_clean_text)
+
+
+# Width of token bitsets (see token_bits())
+_SIGNATURE_BITS = 1024
 
-    return text
+
+def token_bits(tokens: Iterable[str]) -> int:
+    """
+    Fold tokens into a bitset with one (hashed) bit per token.
+
+    ANDing two bitsets and counting bits bounds the token overlap from above
+    (exact unless tokens collide), a cheap pre-filter before set intersection.
+    Bit positions use CRC-32, not hash(): str hashes are salted per process,
+    and bitsets cached on chunks travel across processes (pickle, caches).
+    """
+    bits = 0
+    for token in tokens:
+        bits |= 1 << (zlib.crc32(token.encode("utf-8", "surrogatepass")) & (_SIGNATURE_BITS - 1))
+    return bits
 
 
 def _get_tiktoken():
@@ -46,6 +156,12 @@ def _get_tiktoken():
         ) from e
 
 
+@functools.lru_cache(maxsize=16)
+def _encoding_for(model: str) -> Any:
+    """tiktoken encoding for a model (looked up once per model)."""
+    return _get_tiktoken().encoding_for_model(model)
+
+
 def count_tokens(text: str, model: str = "gpt-4o-mini") -> int:
     """
     Count tokens using tiktoken (accurate for OpenAI models).
@@ -59,11 +175,31 @@ def count_tokens(text: str, model: str = "gpt-4o-mini") -> int:
     Returns:
         Token count
     """
-    tiktoken = _get_tiktoken()
-    encoding = tiktoken.encoding_for_model(model)
+    encoding = _encoding_for(model)
     return len(encoding.encode(text))
 
 
+def count_tokens_batch(texts: list[str], model: str = "gpt-4o-mini") -> list[int]:
+    """
+    Count tokens for many texts at once.
+
+    Encodes on tiktoken's native thread pool (releases the GIL), so large
+    batches use all cores.
+
+    Requires: tiktoken (install via [llm] extras)
+
+    Args:
+        texts: Texts to count
+        model: Model name (for correct encoding)
+
+    Returns:
+        Token counts (same order as texts)
+    """
+    encoding = _encoding_for(model)
+    encoded = encoding.encode_batch(texts, num_threads=os.cpu_count() or 1)
+    return [len(tokens) for tokens in encoded]
+
+
 def truncate_text(text: str, max_tokens: int, model: str = "gpt-4o-mini") -> str:
     """
     Truncate text to fit within token limit.
@@ -78,8 +214,7 @@ def truncate_text(text: str, max_tokens: int, model: str = "gpt-4o-mini") -> str
     Returns:
         Truncated text
     """
-    tiktoken = _get_tiktoken()
-    encoding = tiktoken.encoding_for_model(model)
+    encoding = _encoding_for(model)
     tokens = encoding.encode(text)
 
     if len(tokens) <= max_tokens:
@@ -10,6 +10,18 @@ from rag_core.stores.migrations import drop_schema, ensure_schema
 from rag_core.stores.pgvector_store import PgVectorStore
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Run numba kernels as plain Python unless RUN_NUMBA_JIT=1.
+
+    Compiling every kernel (per worker, under coverage) dominates unit test
+    time; the numba_compile suite (make test-numba) sets RUN_NUMBA_JIT=1 to
+    keep the compiled paths covered. Must run before numba is first imported.
+    """
+    if os.getenv("RUN_NUMBA_JIT") != "1":
+        os.environ.setdefault("NUMBA_DISABLE_JIT", "1")
+
+
 @pytest.fixture(scope="session")
 def postgres_connection_string() -> str:
     """Postgres connection string for tests."""
@@ -3,7 +3,15 @@
 import pytest
 from psycopg import Connection
 from psycopg.errors import ForeignKeyViolation
-from rag_core.config import EMBEDDING_DIM
+from rag_core.config import EMBEDDING_DIM, EMBEDDING_PRECISION
+from rag_core.stores import migrations
+from rag_core.stores.migrations import (
+    HALFVEC_MIN_VERSION,
+    _index_opclass,
+    _parse_version,
+    embedding_column_type,
+    ensure_schema,
+)
 
 
 @pytest.mark.integration
@@ -37,6 +45,20 @@ def test_schema_initialization(pg_conn: Connection):
         assert cur.fetchone() is not None, "Vector index not found (HNSW or IVFFlat)"
 
 
+@pytest.mark.integration
+def test_embedding_column_type_follows_pgvector_version(pg_conn: Connection):
+    """Test embeddings use halfvec storage when pgvector supports it."""
+    with pg_conn.cursor() as cur:
+        cur.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector';")
+        row = cur.fetchone()
+        assert row is not None
+        version = row[0]
+
+    supported = _parse_version(version) >= HALFVEC_MIN_VERSION
+    expected = "halfvec" if supported and EMBEDDING_PRECISION == "half" else "vector"
+    assert embedding_column_type(pg_conn) == expected
+
+
 @pytest.mark.integration
 def test_foreign_key_constraint(pg_conn: Connection):
     """Test document-chunk foreign key works."""
@@ -54,3 +76,82 @@ def test_foreign_key_constraint(pg_conn: Connection):
 
     # Rollback the failed transaction so fixture teardown works
     pg_conn.rollback()
+
+
+@pytest.mark.integration
+def test_ensure_schema_with_build_settings(pg_conn: Connection):
+    """Test re-running ensure_schema with index build settings is idempotent."""
+    ensure_schema(pg_conn, maintenance_work_mem="128MB", max_parallel_maintenance_workers=2)
+
+    with pg_conn.cursor() as cur:
+        cur.execute("""
+            SELECT indexname FROM pg_indexes
+            WHERE tablename = 'chunks'
+              AND indexname IN (
+                'chunks_document_id_idx', 'chunks_metadata_gin_idx', 'chunks_created_at_idx'
+              );
+            """)
+        assert len(cur.fetchall()) == 3
+
+        # Build settings are transaction-local
+        cur.execute("SHOW maintenance_work_mem;")
+        row = cur.fetchone()
+        assert row is not None and row[0] != "128MB"
+
+
+@pytest.mark.integration
+def test_ensure_schema_analyzes_tables(pg_conn: Connection):
+    """Test planner statistics are collected during schema setup."""
+    with pg_conn.cursor() as cur:
+        cur.execute("""
+            SELECT last_analyze FROM pg_stat_user_tables WHERE relname = 'chunks';
+            """)
+        row = cur.fetchone()
+        assert row is not None and row[0] is not None
+
+
+@pytest.mark.integration
+def test_ensure_schema_rebuilds_index_for_other_metric(pg_conn: Connection, monkeypatch):
+    """Test a vector index built for the other distance metric is replaced."""
+    column_type = embedding_column_type(pg_conn)
+    metric = "ip" if migrations.NORMALIZE_EMBEDDINGS else "cosine"
+
+    monkeypatch.setattr(migrations, "NORMALIZE_EMBEDDINGS", not migrations.NORMALIZE_EMBEDDINGS)
+    ensure_schema(pg_conn)
+    assert _index_opclass(pg_conn, "chunks_embedding_hnsw_idx") != f"{column_type}_{metric}_ops"
+
+    monkeypatch.undo()
+    ensure_schema(pg_conn)
+    assert _index_opclass(pg_conn, "chunks_embedding_hnsw_idx") == f"{column_type}_{metric}_ops"
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("value, refused", [(0.5, True), (1.0, False)])
+def test_ensure_schema_refuses_ip_index_for_unnormalized_data(
+    pg_conn: Connection, monkeypatch, value, refused
+):
+    """Test switching to the inner-product index requires unit-length stored embeddings."""
+    monkeypatch.setattr(migrations, "NORMALIZE_EMBEDDINGS", False)
+    ensure_schema(pg_conn)
+    embedding = [0.0] * EMBEDDING_DIM
+    embedding[0] = value
+    with pg_conn.cursor() as cur:
+        cur.execute(
+            "INSERT INTO documents (id, title, source_uri) VALUES ('doc_norm', 'Doc', 'test://');"
+        )
+        cur.execute(
+            "INSERT INTO chunks (id, document_id, text, embedding) "
+            "VALUES ('chunk_norm', 'doc_norm', 'Chunk', %s);",
+            (embedding,),
+        )
+    pg_conn.commit()
+
+    monkeypatch.setattr(migrations, "NORMALIZE_EMBEDDINGS", True)
+    if refused:
+        with pytest.raises(RuntimeError, match="not unit-length"):
+            ensure_schema(pg_conn)
+        pg_conn.rollback()
+    else:
+        ensure_schema(pg_conn)
+        column_type = embedding_column_type(pg_conn)
+        assert _index_opclass(pg_conn, "chunks_embedding_hnsw_idx") == f"{column_type}_ip_ops"
@@ -1,10 +1,18 @@
 """Test vector similarity search end-to-end."""
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pytest
+from psycopg import Connection
 from rag_core.config import EMBEDDING_DIM
+from rag_core.retrieval.filters import MetadataFilter
 from rag_core.schemas.models import Chunk, Document
+from rag_core.stores import pgvector_store
+from rag_core.stores.cache import ProximityCache
 from rag_core.stores.pgvector_store import PgVectorStore
 
 logger = logging.getLogger(__name__)
@@ -42,6 +50,38 @@ def test_document_crud(vector_store: PgVectorStore):
     assert vector_store.get_document("test_doc_001") is None
 
 
+@pytest.mark.integration
+@pytest.mark.parametrize("codec", ["orjson", "json"])
+def test_metadata_json_roundtrip(
+    pg_conn: Connection, postgres_connection_string: str, monkeypatch, codec
+):
+    """Test JSONB metadata round-trips with either JSON codec."""
+    if codec == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(pgvector_store, "_get_orjson", lambda: None)
+
+    metadata = {"category": "test", "nested": {"tags": ["a", "b"], "pages": {1: "intro"}}}
+    with PgVectorStore(postgres_connection_string) as store:
+        store.upsert_document(
+            Document(
+                id="test_doc_json",
+                title="Doc",
+                source_uri="test://",
+                content=None,
+                metadata=metadata,
+            )
+        )
+        retrieved = store.get_document("test_doc_json")
+
+    assert retrieved is not None
+    # JSON object keys are always strings
+    assert retrieved.metadata == {
+        "category": "test",
+        "nested": {"tags": ["a", "b"], "pages": {"1": "intro"}},
+    }
+
+
 @pytest.mark.integration
 def test_chunk_crud(vector_store: PgVectorStore):
     """Test chunk CRUD operations."""
@@ -69,6 +109,36 @@ def test_chunk_crud(vector_store: PgVectorStore):
     assert len(retrieved.embedding) == EMBEDDING_DIM
 
 
+@pytest.mark.integration
+def test_get_skips_validation_unless_strict(vector_store: PgVectorStore, monkeypatch):
+    """Test trusted reads match fully validated reads."""
+    doc = Document(
+        id="test_doc_013", title="Doc", source_uri="test://", content=None, metadata={"a": 1}
+    )
+    chunk = Chunk(
+        id="test_chunk_013",
+        document_id="test_doc_013",
+        text="Trusted row",
+        embedding=[0.1] * EMBEDDING_DIM,
+        metadata={"page": 2},
+        chunk_index=3,
+        start_char=0,
+        end_char=11,
+    )
+    vector_store.upsert_document(doc)
+    vector_store.upsert_chunk(chunk)
+
+    trusted_doc = vector_store.get_document(doc.id)
+    trusted_chunk = vector_store.get_chunk(chunk.id)
+    monkeypatch.setattr(vector_store, "_strict", True)
+    strict_doc = vector_store.get_document(doc.id)
+    strict_chunk = vector_store.get_chunk(chunk.id)
+
+    assert trusted_doc == strict_doc
+    assert trusted_chunk == strict_chunk
+    assert trusted_chunk is not None and trusted_chunk.embedding.dtype == np.float32
+
+
 @pytest.mark.integration
 def test_similarity_search(vector_store: PgVectorStore):
     doc = Document(id="test_doc_003", title="Doc", source_uri="test://", content=None)
@@ -125,6 +195,12 @@ def test_similarity_search(vector_store: PgVectorStore):
     assert results[0].chunk.id == "chunk_1"
     assert results[0].score > 0.9  # Very high similarity
 
+    # Threshold drops the orthogonal chunks (score 0.0) from the same top-k
+    above = vector_store.similarity_search(query_embedding=query_embedding, top_k=3, threshold=0.5)
+    assert [r.chunk.id for r in above] == ["chunk_1"]
+    batched = vector_store.similarity_search_batch([query_embedding], top_k=3, threshold=0.5)
+    assert [r.chunk.id for r in batched[0]] == ["chunk_1"]
+
 
 @pytest.mark.integration
 def test_similarity_search_with_filters(vector_store: PgVectorStore):
@@ -160,6 +236,51 @@ def test_similarity_search_with_filters(vector_store: PgVectorStore):
     assert len(results) == 2
     assert all(r.chunk.metadata["category"] == "A" for r in results)
 
+    # Compiled filters select the same rows
+    compiled = vector_store.similarity_search(
+        query_embedding=[0.1] * EMBEDDING_DIM,
+        top_k=10,
+        filters=MetadataFilter.compile_filters({"category": "A"}),
+        threshold=0.0,
+    )
+    assert [r.chunk.id for r in compiled] == [r.chunk.id for r in results]
+
+
+@pytest.mark.integration
+def test_similarity_search_with_multi_key_and_nested_filters(vector_store: PgVectorStore):
+    """Test multi-key and nested filters are applied as one containment check."""
+    doc = Document(id="test_doc_012", title="Doc", source_uri="test://", content=None)
+    vector_store.upsert_document(doc)
+
+    metadata = [
+        {"category": "A", "person": {"name": "Alice", "role": "pilot"}},
+        {"category": "A", "person": {"name": "Bob"}},
+        {"category": "B", "person": {"name": "Alice"}},
+    ]
+    vector_store.upsert_chunks_batch(
+        [
+            Chunk(
+                id=f"chunk_nested_{i}",
+                document_id="test_doc_012",
+                text=f"Chunk {i}",
+                embedding=[0.1] * EMBEDDING_DIM,
+                metadata=m,
+                chunk_index=i,
+                start_char=None,
+                end_char=None,
+            )
+            for i, m in enumerate(metadata)
+        ]
+    )
+
+    results = vector_store.similarity_search(
+        query_embedding=[0.1] * EMBEDDING_DIM,
+        top_k=10,
+        filters={"category": "A", "person": {"name": "Alice"}},
+    )
+
+    assert [r.chunk.id for r in results] == ["chunk_nested_0"]
+
 
 @pytest.mark.integration
 def test_batch_upsert_performance(vector_store: PgVectorStore):
@@ -194,3 +315,406 @@ def test_batch_upsert_performance(vector_store: PgVectorStore):
 
     # Removed timing assertion (CI-flaky on shared runners)
     logger.info("✓ Batch upsert of 100 chunks verified")
+
+
+@pytest.mark.integration
+def test_similarity_search_batch(vector_store: PgVectorStore):
+    """Test batched search matches per-query search."""
+    doc = Document(id="test_doc_006", title="Doc", source_uri="test://", content=None)
+    vector_store.upsert_document(doc)
+
+    chunks = [
+        Chunk(
+            id=f"chunk_multi_{i}",
+            document_id="test_doc_006",
+            text=f"Chunk {i}",
+            embedding=_unit_vec(EMBEDDING_DIM, i),
+            chunk_index=i,
+            start_char=None,
+            end_char=None,
+        )
+        for i in range(3)
+    ]
+    vector_store.upsert_chunks_batch(chunks)
+
+    queries = [_unit_vec(EMBEDDING_DIM, 2), _unit_vec(EMBEDDING_DIM, 0)]
+    batched = vector_store.similarity_search_batch(queries, top_k=2, threshold=0.0)
+
+    assert len(batched) == 2
+    for query, results in zip(queries, batched, strict=True):
+        single = vector_store.similarity_search(query, top_k=2, threshold=0.0)
+        assert [r.chunk.id for r in results] == [r.chunk.id for r in single]
+        assert [r.rank for r in results] == [1, 2]
+
+    assert batched[0][0].chunk.id == "chunk_multi_2"
+    assert batched[1][0].chunk.id == "chunk_multi_0"
+
+    # One (N, dim) float32 array is accepted as-is
+    from_array = vector_store.similarity_search_batch(
+        np.asarray(queries, dtype=np.float32), top_k=2, threshold=0.0
+    )
+    assert [[r.chunk.id for r in hits] for hits in from_array] == [
+        [r.chunk.id for r in hits] for hits in batched
+    ]
+
+
+@pytest.mark.integration
+def test_similarity_score_is_scale_invariant(vector_store: PgVectorStore):
+    """Test scores stay cosine similarity regardless of vector magnitude."""
+    doc = Document(id="test_doc_007", title="Doc", source_uri="test://", content=None)
+    vector_store.upsert_document(doc)
+
+    embedding = [0.0] * EMBEDDING_DIM
+    embedding[0], embedding[1] = 3.0, 4.0
+    chunk = Chunk(
+        id="chunk_scaled",
+        document_id="test_doc_007",
+        text="Scaled chunk",
+        embedding=embedding,
+        chunk_index=0,
+        start_char=None,
+        end_char=None,
+    )
+    vector_store.upsert_chunk(chunk)
+
+    results = vector_store.similarity_search(
+        query_embedding=_unit_vec(EMBEDDING_DIM, 0), top_k=1, threshold=0.0
+    )
+
+    assert len(results) == 1
+    assert results[0].score == pytest.approx(0.6, abs=1e-3)
+
+
+@pytest.mark.integration
+def test_similarity_search_accepts_float32_array(vector_store: PgVectorStore):
+    """Test ndarray queries match list queries and wrong shapes are rejected."""
+    doc = Document(id="test_doc_012", title="Doc", source_uri="test://", content=None)
+    vector_store.upsert_document(doc)
+    vector_store.upsert_chunks_batch(
+        [
+            Chunk(
+                id=f"chunk_np_{i}",
+                document_id="test_doc_012",
+                text=f"Chunk {i}",
+                embedding=np.asarray(_unit_vec(EMBEDDING_DIM, i), dtype=np.float32) * (i + 2),
+                chunk_index=i,
+                start_char=None,
+                end_char=None,
+            )
+            for i in range(3)
+        ]
+    )
+
+    query = _unit_vec(EMBEDDING_DIM, 1)
+    from_list = vector_store.similarity_search(query, top_k=3)
+    from_array = vector_store.similarity_search(np.asarray(query, dtype=np.float32), top_k=3)
+
+    assert [r.chunk.id for r in from_array] == [r.chunk.id for r in from_list]
+    assert from_array[0].chunk.id == "chunk_np_1"
+    assert from_array[0].score == pytest.approx(1.0, abs=1e-3)
+
+    with pytest.raises(ValueError, match=f"{EMBEDDING_DIM}-dim embedding"):
+        vector_store.similarity_search(np.zeros(EMBEDDING_DIM - 1, dtype=np.float32))
+
+
+@pytest.mark.integration
+def test_batch_upsert_updates_existing_and_duplicates(vector_store: PgVectorStore):
+    """Test batch upsert merges into existing rows (last duplicate wins)."""
+    doc = Document(id="test_doc_008", title="Doc", source_uri="test://", content=None)
+    vector_store.upsert_document(doc)
+
+    def make(text: str, metadata: dict) -> Chunk:
+        return Chunk(
+            id="chunk_dup",
+            document_id="test_doc_008",
+            text=text,
+            embedding=_unit_vec(EMBEDDING_DIM, 3),
+            metadata=metadata,
+            chunk_index=0,
+            start_char=0,
+            end_char=len(text),
+        )
+
+    vector_store.upsert_chunks_batch([make("Original", {"v": 1})])
+    vector_store.upsert_chunks_batch([make("First", {"v": 2}), make("Second", {"v": 3})])
+
+    retrieved = vector_store.get_chunk("chunk_dup")
+    assert retrieved is not None
+    assert retrieved.text == "Second"
+    assert retrieved.metadata == {"v": 3}
+    assert retrieved.end_char == len("Second")
+    assert retrieved.created_at.tzinfo is not None
+
+
+@pytest.mark.integration
+def test_similarity_search_proximity_cache(pg_conn: Connection, postgres_connection_string: str):
+    """Test unfiltered searches are cached and writes invalidate the cache."""
+    with PgVectorStore(postgres_connection_string, cache=ProximityCache(tau=0.01)) as store:
+        store.upsert_document(
+            Document(id="test_doc_009", title="Doc", source_uri="test://", content=None)
+        )
+
+        def make(i: int) -> Chunk:
+            return Chunk(
+                id=f"chunk_cached_{i}",
+                document_id="test_doc_009",
+                text=f"Chunk {i}",
+                embedding=_unit_vec(EMBEDDING_DIM, i),
+                chunk_index=i,
+                start_char=None,
+                end_char=None,
+            )
+
+        store.upsert_chunk(make(0))
+        query = _unit_vec(EMBEDDING_DIM, 1)
+
+        first = store.similarity_search(query, top_k=5, threshold=0.0)
+        assert store.cache is not None and len(store.cache) == 1
+        assert [r.chunk.id for r in store.similarity_search(query, top_k=5, threshold=0.0)] == [
+            r.chunk.id for r in first
+        ]
+
+        # Filtered/thresholded searches bypass the cache
+        store.similarity_search(query, top_k=5, threshold=0.5)
+        assert len(store.cache) == 1
+
+        # Writes invalidate cached results
+        store.upsert_chunk(make(1))
+        assert len(store.cache) == 0
+        refreshed = store.similarity_search(query, top_k=5, threshold=0.0)
+        assert refreshed[0].chunk.id == "chunk_cached_1"
+
+        # Searches inside transaction() skip the cache; rolled-back rows never linger
+        with pytest.raises(RuntimeError, match="boom"):
+            with store.transaction():
+                store.upsert_chunk(make(2))
+                inside = store.similarity_search(_unit_vec(EMBEDDING_DIM, 2), top_k=1)
+                assert inside[0].chunk.id == "chunk_cached_2"
+                assert len(store.cache) == 0
+                raise RuntimeError("boom")
+        after = store.similarity_search(_unit_vec(EMBEDDING_DIM, 2), top_k=1)
+        assert after[0].chunk.id != "chunk_cached_2"
+
+
+@pytest.mark.integration
+def test_similarity_search_embeddings_on_request(vector_store: PgVectorStore):
+    """Test search skips embeddings unless return_embedding=True."""
+    doc = Document(id="test_doc_010", title="Doc", source_uri="test://", content=None)
+    vector_store.upsert_document(doc)
+    vector_store.upsert_chunk(
+        Chunk(
+            id="chunk_emb",
+            document_id="test_doc_010",
+            text="Chunk with embedding",
+            embedding=_unit_vec(EMBEDDING_DIM, 4),
+            metadata={"source": "manual.pdf"},
+            chunk_index=0,
+            start_char=None,
+            end_char=None,
+        )
+    )
+    query = _unit_vec(EMBEDDING_DIM, 4)
+
+    (light,) = vector_store.similarity_search(query, top_k=1)
+    assert light.chunk.embedding is None
+    assert light.chunk.metadata == {"source": "manual.pdf"}
+    assert light.to_pydantic().model_dump_json()
+
+    (full,) = vector_store.similarity_search(query, top_k=1, return_embedding=True)
+    assert full.chunk.embedding.dtype == np.float32
+    assert full.chunk.embedding[4] == pytest.approx(1.0, abs=1e-3)
+
+    (batched,) = vector_store.similarity_search_batch([query], top_k=1, return_embedding=True)
+    assert batched[0].chunk.embedding.shape == (EMBEDDING_DIM,)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("prepare_threshold, expect_prepared", [(0, True), (None, False)])
+def test_statements_prepared_per_connection(
+    pg_conn: Connection, postgres_connection_string: str, prepare_threshold, expect_prepared
+):
+    """Test hot statements are server-side prepared on first use (unless disabled)."""
+    with PgVectorStore(postgres_connection_string, prepare_threshold=prepare_threshold) as store:
+        assert store.get_document("missing_doc") is None
+        assert store._conn is not None
+
+        with store._conn.cursor() as cur:
+            cur.execute("""
+                SELECT count(*) AS n FROM pg_prepared_statements
+                WHERE statement LIKE '%%FROM documents WHERE id%%'
+                  AND statement NOT LIKE '%%pg_prepared_statements%%';
+                """)
+            row = cur.fetchone()
+
+    assert row is not None
+    assert (row["n"] > 0) is expect_prepared
+
+
+@pytest.mark.integration
+def test_transaction_groups_writes(vector_store: PgVectorStore):
+    """Test writes inside transaction() commit together or not at all."""
+    vector_store.get_document("missing_doc")  # Leaves an implicit read transaction open
+
+    with vector_store.transaction():
+        for i in range(3):
+            vector_store.upsert_document(
+                Document(id=f"test_doc_tx_{i}", title="Doc", source_uri="test://", content=None)
+            )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        with vector_store.transaction():
+            vector_store.upsert_document(
+                Document(id="test_doc_tx_rollback", title="Doc", source_uri="test://", content=None)
+            )
+            raise RuntimeError("boom")
+
+    # Committed data is visible from another connection
+    with PgVectorStore(vector_store.connection_string) as other:
+        assert all(other.get_document(f"test_doc_tx_{i}") is not None for i in range(3))
+        assert other.get_document("test_doc_tx_rollback") is None
+
+
+@pytest.mark.integration
+def test_transaction_isolated_from_other_threads(vector_store: PgVectorStore):
+    """Test another thread's write during a transaction() block is not rolled back with it."""
+    writer = threading.Thread(
+        target=vector_store.upsert_document,
+        args=(Document(id="test_doc_tx_other", title="Doc", source_uri="test://", content=None),),
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        with vector_store.transaction():
+            vector_store.upsert_document(
+                Document(id="test_doc_tx_own", title="Doc", source_uri="test://", content=None)
+            )
+            writer.start()
+            time.sleep(0.1)  # Writer waits for the block instead of joining it
+            raise RuntimeError("boom")
+    writer.join(timeout=5)
+
+    with PgVectorStore(vector_store.connection_string) as other:
+        assert other.get_document("test_doc_tx_other") is not None
+        assert other.get_document("test_doc_tx_own") is None
+
+
+@pytest.mark.integration
+def test_similarity_search_ef_search_is_query_local(vector_store: PgVectorStore):
+    """Test per-query ef_search returns results and does not leak to later queries."""
+    doc = Document(id="test_doc_011", title="Doc", source_uri="test://", content=None)
+    vector_store.upsert_document(doc)
+    vector_store.upsert_chunks_batch(
+        [
+            Chunk(
+                id=f"chunk_ef_{i}",
+                document_id="test_doc_011",
+                text=f"Chunk {i}",
+                embedding=_unit_vec(EMBEDDING_DIM, i),
+                chunk_index=i,
+                start_char=None,
+                end_char=None,
+            )
+            for i in range(3)
+        ]
+    )
+
+    results = vector_store.similarity_search(_unit_vec(EMBEDDING_DIM, 2), top_k=3, ef_search=1)
+    assert results[0].chunk.id == "chunk_ef_2"
+
+    assert vector_store._conn is not None
+    with vector_store._conn.cursor() as cur:
+        cur.execute("SELECT current_setting('hnsw.ef_search', true) AS ef;")
+        row = cur.fetchone()
+    assert row is not None and row["ef"] != "3"
+
+
+@pytest.mark.integration
+def test_store_reuses_one_cursor(postgres_connection_string: str, pg_conn: Connection):
+    """Test store methods share the connection's cursor, which close() releases."""
+    store = PgVectorStore(postgres_connection_string)
+    store.connect()
+    cursor = store._cur
+    assert cursor is not None
+
+    store.upsert_document(
+        Document(id="test_doc_cur", title="Doc", source_uri="test://", content=None)
+    )
+    assert store.get_document("test_doc_cur") is not None
+    assert store._cur is cursor
+
+    store.close()
+    assert cursor.closed
+    with pytest.raises(RuntimeError, match="Not connected"):
+        store.get_document("test_doc_cur")
+
+
+@pytest.mark.integration
+def test_pooled_store_concurrent_searches(pg_conn: Connection, postgres_connection_string: str):
+    """Test a pooled store serves concurrent threads and pins transaction() blocks."""
+    pytest.importorskip("psycopg_pool")
+
+    with PgVectorStore(postgres_connection_string, pool_size=4) as store:
+        assert store._conn is None
+
+        with store.transaction():
+            store.upsert_document(
+                Document(id="test_doc_pool", title="Doc", source_uri="test://", content=None)
+            )
+            store.upsert_chunks_batch(
+                [
+                    Chunk(
+                        id=f"chunk_pool_{i}",
+                        document_id="test_doc_pool",
+                        text=f"Chunk {i}",
+                        embedding=_unit_vec(EMBEDDING_DIM, i),
+                        chunk_index=i,
+                        start_char=None,
+                        end_char=None,
+                    )
+                    for i in range(4)
+                ]
+            )
+
+        with pytest.raises(RuntimeError, match="boom"):
+            with store.transaction():
+                store.delete_document("test_doc_pool")
+                raise RuntimeError("boom")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            top_ids = list(
+                executor.map(
+                    lambda i: store.similarity_search(
+                        _unit_vec(EMBEDDING_DIM, i), top_k=1, ef_search=40
+                    )[0].chunk.id,
+                    range(4),
+                )
+            )
+
+    assert top_ids == [f"chunk_pool_{i}" for i in range(4)]
+
+
+@pytest.mark.integration
+def test_pooled_transaction_reuses_pinned_connection(
+    pg_conn: Connection, postgres_connection_string: str
+):
+    """Test writes inside transaction() need no second pooled connection."""
+    pytest.importorskip("psycopg_pool")
+
+    with PgVectorStore(postgres_connection_string, pool_size=1) as store:
+        store._pool.timeout = 2  # Fail fast instead of hanging if a second checkout happens
+        with store.transaction():
+            store.upsert_document(
+                Document(id="test_doc_pool1", title="Doc", source_uri="test://", content=None)
+            )
+            store.upsert_chunk(
+                Chunk(
+                    id="chunk_pool1",
+                    document_id="test_doc_pool1",
+                    text="Chunk",
+                    embedding=_unit_vec(EMBEDDING_DIM, 0),
+                    chunk_index=0,
+                    start_char=None,
+                    end_char=None,
+                )
+            )
+
+        assert store.get_chunk("chunk_pool1") is not None
@@ -0,0 +1 @@
+"""Numba JIT tests (run with RUN_NUMBA_JIT=1 pytest -m numba_compile)."""
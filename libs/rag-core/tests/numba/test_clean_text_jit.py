@@ -0,0 +1,46 @@
+"""Test compiled numba kernels match their plain-Python versions."""
+
+import numpy as np
+import pytest
+from rag_core.utils import text as text_utils
+
+numba = pytest.importorskip("numba")
+
+pytestmark = [
+    pytest.mark.numba_compile,
+    pytest.mark.skipif(
+        numba.config.DISABLE_JIT, reason="JIT disabled (set RUN_NUMBA_JIT=1 to enable)"
+    ),
+]
+
+CORPUS = [
+    "",
+    "plain",
+    "  Hello\n\n\nworld  \n  ",
+    "a\n\n\n\n\nb   c",
+    "Café  au lait\n\n\n\tnaïve  ",
+    " \n \n\n\n  \n",
+    "日本語  テキスト\n\n\n\n終わり",
+    "word " * 1_000 + "\n" * 50 + "  end  ",
+]
+
+
+@pytest.fixture(scope="module")
+def collapse():
+    """Compiled whitespace kernel."""
+    kernel = text_utils._get_numba_collapse()
+    assert kernel.py_func is text_utils._collapse_whitespace
+    return kernel
+
+
+@pytest.mark.parametrize("text", CORPUS)
+def test_collapse_whitespace_jit_matches_py_func(collapse, text):
+    """Test the compiled kernel and its Python body produce the same bytes."""
+    buf = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+    outputs = []
+    for kernel in (collapse, collapse.py_func):
+        out = np.empty_like(buf)
+        n = kernel(buf, out)
+        outputs.append(out[:n].tobytes())
+
+    assert outputs[0] == outputs[1]
@@ -0,0 +1,111 @@
+"""Test proximity cache for similarity search results."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from rag_core.config import EMBEDDING_DIM
+from rag_core.schemas.fast import RetrievalResultFast
+from rag_core.schemas.models import Chunk
+from rag_core.stores.cache import ProximityCache
+
+
+def _vec(*pairs: tuple[int, float]) -> np.ndarray:
+    v = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+    for idx, value in pairs:
+        v[idx] = value
+    return v
+
+
+def _results(n: int) -> list[RetrievalResultFast]:
+    return [
+        RetrievalResultFast(
+            chunk=Chunk(
+                document_id="doc_123",
+                text=f"Chunk {i}",
+                embedding=_vec((i, 1.0)),
+                chunk_index=i,
+                start_char=None,
+                end_char=None,
+            ),
+            score=1.0 - i * 0.1,
+            rank=i + 1,
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.mark.unit
+def test_cache_hit_for_near_duplicate_query():
+    """Test queries within tau of a cached query hit."""
+    cache = ProximityCache(capacity=4, tau=0.01)
+    results = _results(3)
+    cache.put(_vec((0, 1.0)), 3, results)
+
+    hit = cache.get(_vec((0, 2.0), (1, 0.05)), 3)  # Scaled, slightly rotated
+
+    assert hit is not None
+    assert [r.chunk.id for r in hit] == [r.chunk.id for r in results]
+    assert hit[0] is not results[0]  # Fresh objects (callers may rerank in place)
+
+
+@pytest.mark.unit
+def test_cache_miss_beyond_tau_or_larger_top_k():
+    """Test distant queries and larger top_k miss."""
+    cache = ProximityCache(capacity=4, tau=0.01)
+    cache.put(_vec((0, 1.0)), 2, _results(2))
+
+    assert cache.get(_vec((1, 1.0)), 2) is None
+    assert cache.get(_vec((0, 1.0)), 5) is None
+    assert len(cache.get(_vec((0, 1.0)), 1) or []) == 1
+
+
+@pytest.mark.unit
+def test_cache_evicts_least_recently_used():
+    """Test the least recently used entry is overwritten when full."""
+    cache = ProximityCache(capacity=2, tau=0.01)
+    cache.put(_vec((0, 1.0)), 1, _results(1))
+    cache.put(_vec((1, 1.0)), 1, _results(1))
+    cache.get(_vec((0, 1.0)), 1)  # Touch first entry
+
+    cache.put(_vec((2, 1.0)), 1, _results(1))
+
+    assert len(cache) == 2
+    assert cache.get(_vec((0, 1.0)), 1) is not None
+    assert cache.get(_vec((1, 1.0)), 1) is None
+    assert cache.get(_vec((2, 1.0)), 1) is not None
+
+
+@pytest.mark.unit
+def test_cache_clear_and_zero_query():
+    """Test clear() empties the cache and zero vectors are never cached."""
+    cache = ProximityCache()
+    cache.put(np.zeros(EMBEDDING_DIM), 1, _results(1))
+    assert len(cache) == 0
+
+    cache.put(_vec((0, 1.0)), 1, _results(1))
+    cache.clear()
+    assert cache.get(_vec((0, 1.0)), 1) is None
+
+
+@pytest.mark.unit
+def test_cache_rejects_invalid_settings():
+    """Test invalid capacity/tau raise ValueError."""
+    with pytest.raises(ValueError, match="capacity"):
+        ProximityCache(capacity=0)
+    with pytest.raises(ValueError, match="tau"):
+        ProximityCache(tau=-0.1)
+
+
+@pytest.mark.unit
+def test_cache_concurrent_puts():
+    """Test concurrent puts fill distinct slots without exceeding capacity."""
+    cache = ProximityCache(capacity=64, tau=0.01)
+    results = _results(1)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: cache.put(_vec((i, 1.0)), 1, results), range(256)))
+
+    assert len(cache) == 64
+    # Every slot holds a different query (no two puts claimed the same slot)
+    assert len({int(np.argmax(key)) for key in cache._keys}) == 64
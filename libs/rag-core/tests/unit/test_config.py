@@ -0,0 +1,31 @@
+"""Test configuration validation."""
+
+import pytest
+from rag_core.config import (
+    EMBEDDING_DIM,
+    EMBEDDING_PRECISION,
+    SUPPORTED_EMBEDDING_DIMS,
+    SUPPORTED_EMBEDDING_PRECISIONS,
+    validate_embedding_dim,
+)
+
+
+@pytest.mark.unit
+def test_configured_dim_is_supported():
+    """Test the configured embedding dimension passes validation."""
+    assert EMBEDDING_DIM in SUPPORTED_EMBEDDING_DIMS
+    validate_embedding_dim(EMBEDDING_DIM)
+
+
+@pytest.mark.unit
+def test_unsupported_dim_raises_every_call():
+    """Test invalid dimensions are never cached as valid."""
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Unsupported embedding dimension: 768"):
+            validate_embedding_dim(768)
+
+
+@pytest.mark.unit
+def test_configured_precision_is_supported():
+    """Test the configured embedding precision is a supported value."""
+    assert EMBEDDING_PRECISION in SUPPORTED_EMBEDDING_PRECISIONS
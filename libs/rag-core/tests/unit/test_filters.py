@@ -26,3 +26,33 @@ def test_build_filters_empty():
     """Test building empty filters."""
     filters = MetadataFilter.build_filters()
     assert filters == {}
+
+
+@pytest.mark.unit
+def test_compile_filters_serializes_once():
+    """Test compiled filters are cached per filter shape."""
+    first = MetadataFilter.compile_filters({"source": "manual.pdf", "tags": ["a", "b"]})
+    second = MetadataFilter.compile_filters({"tags": ["a", "b"], "source": "manual.pdf"})
+
+    assert first is second
+    assert first.filters_json == '{"source": "manual.pdf", "tags": ["a", "b"]}'
+
+
+@pytest.mark.unit
+def test_compile_filters_distinguishes_equal_scalars():
+    """Test 1, 1.0 and True (equal in Python) compile to their own JSON."""
+    assert MetadataFilter.compile_filters({"page": 1}).filters_json == '{"page": 1}'
+    assert MetadataFilter.compile_filters({"page": True}).filters_json == '{"page": true}'
+    assert MetadataFilter.compile_filters({"page": 1.0}).filters_json == '{"page": 1.0}'
+    assert MetadataFilter.compile_filters({"tags": [1]}).filters_json == '{"tags": [1]}'
+    assert MetadataFilter.compile_filters({"tags": [True]}).filters_json == '{"tags": [true]}'
+
+
+@pytest.mark.unit
+def test_compile_filters_nested_dict():
+    """Test nested filter dicts compile (and cache) like flat ones."""
+    first = MetadataFilter.compile_filters({"person": {"name": "Alice", "age": 30}})
+    second = MetadataFilter.compile_filters({"person": {"age": 30, "name": "Alice"}})
+
+    assert first is second
+    assert first.filters_json == '{"person": {"age": 30, "name": "Alice"}}'
@@ -0,0 +1,210 @@
+"""Test deterministic graders."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from rag_core.grading import deterministic
+from rag_core.grading.deterministic import (
+    DeterministicGroundednessGrader,
+    DeterministicRelevanceGrader,
+)
+from rag_core.schemas.fast import RetrievalResultFast
+from rag_core.schemas.models import Chunk
+from rag_core.utils import text as text_utils
+
+
+def _result(text: str, rank: int = 1) -> RetrievalResultFast:
+    chunk = Chunk(
+        document_id="doc_123",
+        text=text,
+        embedding=[0.1] * 1536,
+        chunk_index=0,
+        start_char=None,
+        end_char=None,
+    )
+    return RetrievalResultFast(chunk=chunk, score=0.9, rank=rank)
+
+
+@pytest.mark.unit
+def test_relevance_grade():
+    """Test keyword overlap scoring."""
+    grader = DeterministicRelevanceGrader(threshold=0.5)
+
+    grade = grader.grade("Drone battery life", "The drone has a long BATTERY")
+
+    assert grade.passed
+    assert grade.score == pytest.approx(2 / 3)
+
+
+@pytest.mark.unit
+def test_relevance_grade_batch_matches_grade():
+    """Test batch grading matches per-result grading."""
+    grader = DeterministicRelevanceGrader()
+    query = "how long does the drone battery last"
+    results = [
+        _result("The drone battery lasts forty minutes."),
+        _result("Firmware updates are installed over USB.", rank=2),
+        _result("How long is the warranty?", rank=3),
+    ]
+
+    batch = grader.grade_batch(query, results)
+
+    assert batch == [grader.grade(query, r.chunk.text) for r in results]
+    assert [g.passed for g in batch] == [True, False, True]
+
+
+@pytest.mark.unit
+def test_filter_relevant():
+    """Test filtering keeps relevant results in order."""
+    grader = DeterministicRelevanceGrader()
+    results = [
+        _result("The drone battery lasts forty minutes."),
+        _result("Firmware updates are installed over USB.", rank=2),
+        _result("Spare drone battery packs are sold separately.", rank=3),
+    ]
+
+    filtered = grader.filter_relevant("drone battery life", results)
+    assert [r.rank for r in filtered] == [1, 3]
+
+    assert grader.filter_relevant("drone battery life", results, threshold=0.9) == []
+
+
+@pytest.mark.unit
+def test_filter_relevant_max_results():
+    """Test filtering stops once enough relevant results are found."""
+    grader = DeterministicRelevanceGrader()
+    results = [
+        _result("The drone battery lasts forty minutes."),
+        _result("Spare drone battery packs are sold separately.", rank=2),
+    ]
+
+    filtered = grader.filter_relevant("drone battery life", results, max_results=1)
+
+    assert [r.rank for r in filtered] == [1]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("signature_bits", [1024, 1])
+def test_filter_relevant_bitset_prefilter_is_exact(monkeypatch, signature_bits):
+    """Test the bitset pre-filter never changes which results pass."""
+    # 1 bit forces every query token into the same bit (exact fallback path)
+    monkeypatch.setattr(text_utils, "_SIGNATURE_BITS", signature_bits)
+
+    grader = DeterministicRelevanceGrader(threshold=0.3)
+    query = "how long does the drone battery last in cold weather"
+    results = [
+        _result("The drone battery lasts forty minutes.", rank=1),
+        _result("Firmware updates are installed over USB.", rank=2),
+        _result("Cold weather shortens how long the battery will last.", rank=3),
+        _result("Does the drone float?", rank=4),
+    ]
+
+    expected = [
+        r for r, g in zip(results, grader.grade_batch(query, results), strict=True) if g.passed
+    ]
+    assert grader.filter_relevant(query, results) == expected
+
+
+@pytest.fixture(params=["ahocorasick", "substring"])
+def matcher(request, monkeypatch):
+    """Run groundedness tests against both trigram matchers."""
+    if request.param == "ahocorasick":
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(deterministic, "_get_ahocorasick", lambda: None)
+    return request.param
+
+
+@pytest.mark.unit
+def test_groundedness_all_sentences_grounded(matcher):
+    """Test answer fully supported by context."""
+    context = [
+        _result("The drone battery lasts forty minutes in calm weather."),
+        _result("Firmware updates are installed over USB.", rank=2),
+    ]
+    answer = "The Drone battery lasts about forty minutes. Firmware updates are installed via USB."
+
+    grade = DeterministicGroundednessGrader().grade(answer, context)
+
+    assert grade.passed
+    assert grade.score == 1.0
+
+
+@pytest.mark.unit
+def test_groundedness_ungrounded_answer(matcher):
+    """Test answer with no support in context."""
+    context = [_result("The drone battery lasts forty minutes in calm weather.")]
+    answer = "Propellers should be replaced every season. Always store them indoors."
+
+    grade = DeterministicGroundednessGrader().grade(answer, context)
+
+    assert not grade.passed
+    assert grade.score == 0.0
+    assert grade.reason == "Grounded sentences: 0/2"
+
+
+@pytest.mark.unit
+def test_groundedness_shared_trigram_counts_each_sentence(matcher):
+    """Test a trigram shared by several sentences grounds all of them."""
+    context = [_result("Check the drone battery before every flight.")]
+    answer = "Always check the drone carefully. Then check the drone again later."
+
+    grade = DeterministicGroundednessGrader().grade(answer, context)
+
+    assert grade.score == 1.0
+
+
+@pytest.mark.unit
+def test_groundedness_no_sentences():
+    """Test short answers are trivially grounded."""
+    grade = DeterministicGroundednessGrader().grade("Yes.", [])
+
+    assert grade.passed
+    assert grade.reason == "No sentences to check"
+
+
+@pytest.mark.unit
+def test_groundedness_is_case_insensitive(matcher):
+    """Test answer and context are compared case-insensitively."""
+    grader = DeterministicGroundednessGrader()
+    context = [_result("The DRONE BATTERY lasts forty minutes in flight.")]
+
+    grade = grader.grade("the drone battery lasts about forty minutes.", context)
+
+    assert grade.passed
+    assert grade.score == 1.0
+
+
+_PICKLE_CHUNK = """
+import pickle, sys
+from rag_core.schemas.models import Chunk
+chunk = Chunk.from_trusted(document_id="doc_123", text="The drone battery lasts long.", embedding=None)
+chunk.token_bits  # Cached on the instance before pickling
+sys.stdout.buffer.write(pickle.dumps(chunk))
+"""
+
+_FILTER_PICKLED = """
+import pickle, sys
+from rag_core.grading.deterministic import DeterministicRelevanceGrader
+from rag_core.schemas.fast import RetrievalResultFast
+chunk = pickle.loads(sys.stdin.buffer.read())
+results = [RetrievalResultFast(chunk, 0.9, 1)]
+print(len(DeterministicRelevanceGrader(threshold=0.3).filter_relevant("drone battery", results)))
+"""
+
+
+@pytest.mark.unit
+def test_filter_relevant_pickled_chunk_other_hash_seed():
+    """Test cached token bitsets stay valid in a process with another hash seed."""
+
+    def run(code: str, seed: str, stdin: bytes = b"") -> bytes:
+        env = {**os.environ, "PYTHONHASHSEED": seed}
+        return subprocess.run(
+            [sys.executable, "-c", code], input=stdin, env=env, capture_output=True, check=True
+        ).stdout
+
+    pickled = run(_PICKLE_CHUNK, "1")
+
+    assert run(_FILTER_PICKLED, "2", pickled).strip() == b"1"
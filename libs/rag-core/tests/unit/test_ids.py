@@ -0,0 +1,20 @@
+"""Test ID generation."""
+
+import re
+
+import pytest
+from rag_core.utils.ids import generate_id
+
+
+@pytest.mark.unit
+def test_generate_id_shape():
+    """Test IDs keep the {prefix}_{12 hex chars} shape."""
+    assert re.fullmatch(r"chunk_[0-9a-f]{12}", generate_id("chunk"))
+    assert re.fullmatch(r"[0-9a-f]{12}", generate_id())
+
+
+@pytest.mark.unit
+def test_generate_id_unique():
+    """Test IDs do not repeat across many calls."""
+    ids = {generate_id("doc") for _ in range(10_000)}
+    assert len(ids) == 10_000
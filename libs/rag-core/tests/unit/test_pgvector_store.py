@@ -0,0 +1,126 @@
+"""Test PgVectorStore helpers (no database required)."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from pgvector import Vector
+from rag_core.config import EMBEDDING_DIM
+from rag_core.schemas.fast import RetrievalResultFast
+from rag_core.schemas.models import Chunk
+from rag_core.stores import pgvector_store
+from rag_core.stores.cache import ProximityCache
+from rag_core.stores.filters import CompiledFilter
+from rag_core.stores.pgvector_store import PgVectorStore, auto_ef_search
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "num_chunks, expected",
+    [(0, 40), (99_999, 40), (100_000, 100), (999_999, 100), (1_000_000, 200)],
+)
+def test_auto_ef_search(num_chunks, expected):
+    """Test ef_search recommendation by table size."""
+    assert auto_ef_search(num_chunks) == expected
+
+
+@pytest.mark.unit
+def test_chunk_row_matches_write_columns():
+    """Test positional chunk parameters line up with the write statements' columns."""
+    chunk = Chunk(
+        document_id="doc_123",
+        text="Hello",
+        embedding=[0.1] * 1536,
+        metadata={"page": 3},
+        chunk_index=7,
+        start_char=10,
+        end_char=15,
+    )
+    embedding = Vector([0.1] * 1536)
+
+    row = PgVectorStore._chunk_row(chunk, embedding)
+    columns = [c.strip() for c in pgvector_store._CHUNK_WRITE_COLUMNS.split(",")]
+
+    assert len(row) == len(columns) == len(pgvector_store._CHUNK_COPY_TYPES)
+    assert pgvector_store._UPSERT_CHUNK_SQL.count("%s") == len(columns)
+    by_column = dict(zip(columns, row, strict=True))
+    assert by_column["id"] == chunk.id
+    assert by_column["embedding"] is embedding
+    assert by_column["metadata"].obj == {"page": 3}
+    assert (by_column["chunk_index"], by_column["start_char"], by_column["end_char"]) == (7, 10, 15)
+    assert by_column["updated_at"] == chunk.updated_at
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"source": "manual.pdf", "tags": ["a"], "person": {"name": "Alice"}},
+        CompiledFilter.from_dict({"source": "manual.pdf", "tags": ["a"]}),
+    ],
+)
+def test_filter_clauses_pack_all_keys_into_one_parameter(filters):
+    """Test every filter key shares one containment clause and one jsonb parameter."""
+    params = {"top_k": 5}
+
+    clauses = PgVectorStore._filter_clauses(filters, params)
+
+    assert clauses == ["metadata @> %(filters_json)s::jsonb"]
+    assert set(params) == {"top_k", "filters_json"}
+    if isinstance(filters, CompiledFilter):
+        assert params["filters_json"] == filters.filters_json
+    else:
+        assert params["filters_json"].obj == filters
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("filters", [None, {}])
+def test_filter_clauses_empty(filters):
+    """Test missing or empty filters add no clause or parameter."""
+    params = {}
+
+    assert PgVectorStore._filter_clauses(filters, params) == []
+    assert params == {}
+
+
+def _mock_connected_store() -> PgVectorStore:
+    """Store wired to a mocked connection (searches return no rows)."""
+    store = PgVectorStore("postgresql://unused", cache=ProximityCache())
+    store._conn = MagicMock()
+    store._cur = MagicMock()
+    store._cur.fetchall.return_value = []
+    store._cur.rowcount = 1
+    store._embedding_type = "vector"
+    return store
+
+
+@pytest.mark.unit
+def test_ef_search_search_bypasses_and_keeps_cache():
+    """Test a per-query ef_search neither wipes nor reads/writes the proximity cache."""
+    store = _mock_connected_store()
+    query = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+    query[0] = 1.0
+    cached = [
+        RetrievalResultFast(
+            Chunk.from_trusted(document_id="doc_123", text="Cached", embedding=None), 0.9, 1
+        )
+    ]
+    store.cache.put(query, 5, cached)
+
+    assert store.similarity_search(query, top_k=5, ef_search=100) == []  # Not served from cache
+    assert len(store.cache) == 1
+    assert store.similarity_search(query, top_k=5)[0].chunk.text == "Cached"
+
+
+@pytest.mark.unit
+def test_writing_transaction_clears_cache_on_exit():
+    """Test a block that wrote drops results cached while it ran."""
+    store = _mock_connected_store()
+    query = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+    query[0] = 1.0
+
+    with store.transaction():
+        store.delete_document("doc_123")
+        store.cache.put(query, 5, [])  # e.g. another thread caching pre-commit data
+
+    assert len(store.cache) == 0
@@ -0,0 +1,59 @@
+"""Test reranking strategies."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from rag_core.retrieval.reranker import Reranker
+from rag_core.schemas.fast import RetrievalResultFast
+from rag_core.schemas.models import Chunk
+
+
+def _result(chunk_id: str, score: float, rank: int, age_days: int) -> RetrievalResultFast:
+    chunk = Chunk(
+        id=chunk_id,
+        document_id="doc_123",
+        text="Example text",
+        embedding=[0.1] * 1536,
+        chunk_index=0,
+        start_char=None,
+        end_char=None,
+        created_at=datetime(2025, 1, 31) - timedelta(days=age_days),
+    )
+    return RetrievalResultFast(chunk=chunk, score=score, rank=rank)
+
+
+@pytest.mark.unit
+def test_rerank_none_is_identity():
+    """Test "none" strategy returns results unchanged."""
+    results = [_result("a", 0.9, 1, 0), _result("b", 0.8, 2, 1)]
+    assert Reranker().rerank(results) is results
+
+
+@pytest.mark.unit
+def test_rerank_unknown_strategy_fails_fast():
+    """Test unknown strategy is rejected at construction."""
+    with pytest.raises(ValueError, match="Unknown reranking strategy"):
+        Reranker(strategy="metadata")
+
+
+@pytest.mark.unit
+def test_rerank_by_recency():
+    """Test newer chunks overtake slightly higher-scored older chunks."""
+    results = [
+        _result("old", 0.82, 1, age_days=30),
+        _result("new", 0.80, 2, age_days=0),
+        _result("mid", 0.50, 3, age_days=10),
+    ]
+
+    reranked = Reranker(strategy="recency").rerank(results)
+
+    assert [r.chunk.id for r in reranked] == ["new", "old", "mid"]
+    assert [r.rank for r in reranked] == [1, 2, 3]
+    assert reranked[0].score == pytest.approx(0.80)
+    assert reranked[1].score == pytest.approx(0.82 * (1 - 2 / 3 * 0.1))
+
+
+@pytest.mark.unit
+def test_rerank_by_recency_empty():
+    """Test empty input."""
+    assert Reranker(strategy="recency").rerank([]) == []
@@ -1,7 +1,7 @@
 """Test retry logic."""
 
 import pytest
-from rag_core.utils.retry import retry_with_backoff
+from rag_core.utils.retry import _delays, retry_with_backoff, retry_with_backoff_async
 
 
 @pytest.mark.unit
@@ -32,3 +32,66 @@ def test_retry_max_attempts():
 
     with pytest.raises(ValueError):
         always_fails()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("jitter", ["none", "full", "decorrelated"])
+def test_delays_stay_within_bounds(jitter):
+    """Test every jitter strategy respects max_delay (and the floor for decorrelated)."""
+    delays = _delays(initial_delay=0.5, backoff_factor=2.0, max_delay=4.0, jitter=jitter)
+    values = [next(delays) for _ in range(50)]
+
+    assert all(0.0 <= v <= 4.0 for v in values)
+    if jitter == "none":
+        assert values[:5] == [0.5, 1.0, 2.0, 4.0, 4.0]
+    if jitter == "decorrelated":
+        assert all(v >= 0.5 for v in values)
+
+
+@pytest.mark.unit
+def test_retry_default_delays_are_exponential(monkeypatch):
+    """Test the default schedule is plain initial_delay * backoff_factor**n (no jitter)."""
+    sleeps = []
+    monkeypatch.setattr("rag_core.utils.retry.time.sleep", sleeps.append)
+
+    @retry_with_backoff(max_retries=5, initial_delay=1.0, backoff_factor=3.0)
+    def always_fails():
+        raise ValueError("Always fails")
+
+    with pytest.raises(ValueError):
+        always_fails()
+    assert sleeps == [1.0, 3.0, 9.0, 27.0]
+
+
+@pytest.mark.unit
+def test_retry_gives_up_when_time_budget_exceeded():
+    """Test max_total_time stops retrying instead of sleeping past the budget."""
+    call_count = 0
+
+    @retry_with_backoff(max_retries=5, initial_delay=10.0, jitter="none", max_total_time=1.0)
+    def always_fails():
+        nonlocal call_count
+        call_count += 1
+        raise ValueError("Always fails")
+
+    with pytest.raises(ValueError):
+        always_fails()
+    assert call_count == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_retry_async_success():
+    """Test async retry with eventual success."""
+    call_count = 0
+
+    @retry_with_backoff_async(max_retries=3, initial_delay=0.01)
+    async def flaky_function():
+        nonlocal call_count
+        call_count += 1
+        if call_count < 3:
+            raise ValueError("Temporary failure")
+        return "success"
+
+    assert await flaky_function() == "success"
+    assert call_count == 3
@@ -1,8 +1,34 @@
 """Test Pydantic schema models."""
 
+from datetime import timedelta
+
+import numpy as np
 import pytest
 from pydantic import ValidationError
-from rag_core.schemas.models import Chunk, Citation, Document
+from pydantic_core import SchemaValidator
+from rag_core.schemas.fast import RetrievalResultFast
+from rag_core.schemas.models import (
+    Chunk,
+    Citation,
+    Document,
+    GradingResult,
+    RetrievalResult,
+    batch_now,
+)
+from rag_core.utils.text import token_bits
+
+# Shared by tests that just need a valid embedding: one read-only allocation at
+# import, which chunks use as-is instead of copying
+_EMB = np.full(1536, 0.1, dtype=np.float32)
+_EMB.flags.writeable = False
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("model", [Chunk, Document, RetrievalResult, Citation, GradingResult])
+def test_model_validators_built_at_import(model):
+    """Test schemas compile when the module is imported, not on first use."""
+    assert model.__pydantic_complete__
+    assert isinstance(model.__pydantic_validator__, SchemaValidator)
 
 
 @pytest.mark.unit
@@ -11,7 +37,7 @@ def test_chunk_model_valid():
     chunk = Chunk(
         document_id="doc_123",
         text="Example text",
-        embedding=[0.1] * 1536,
+        embedding=_EMB,
         metadata={"source": "test.pdf"},
     )
 
@@ -21,6 +47,67 @@ def test_chunk_model_valid():
     assert chunk.id.startswith("chunk_")
 
 
+@pytest.mark.unit
+def test_chunk_model_valid_construct():
+    """Test trusted construction fills defaults like validated construction."""
+    chunk = Chunk.from_trusted(
+        document_id="doc_123",
+        text="Example text",
+        embedding=[0.1] * 1536,
+        metadata={"source": "test.pdf"},
+    )
+
+    assert chunk.id.startswith("chunk_")
+    assert chunk.chunk_index == 0
+    assert chunk.embedding.dtype == np.float32
+    assert chunk == Chunk(**chunk.model_dump())
+
+
+@pytest.mark.unit
+def test_chunk_from_trusted_keeps_missing_embedding():
+    """Test trusted construction passes embedding=None through (search results)."""
+    chunk = Chunk.from_trusted(id="chunk_1", document_id="doc_123", text="x", embedding=None)
+
+    assert chunk.embedding is None
+    assert chunk.id == "chunk_1"
+
+
+@pytest.mark.unit
+def test_chunk_bulk_validate():
+    """Test batch validation of many rows in one call."""
+    rows = [
+        {"document_id": "doc_123", "text": f"Example {i}", "embedding": _EMB, "chunk_index": i}
+        for i in range(10_000)
+    ]
+
+    chunks = Chunk.bulk_validate(rows)
+
+    assert len(chunks) == 10_000
+    assert all(isinstance(c, Chunk) for c in chunks)
+    assert chunks[-1].chunk_index == 9_999
+    assert chunks[0] == Chunk(**rows[0]).model_copy(
+        update={
+            "id": chunks[0].id,
+            "created_at": chunks[0].created_at,
+            "updated_at": chunks[0].updated_at,
+        }
+    )
+
+
+@pytest.mark.unit
+def test_chunk_bulk_validate_reports_row():
+    """Test bulk validation errors point at the offending row."""
+    rows = [
+        {"document_id": "doc_123", "text": "Example", "embedding": _EMB},
+        {"document_id": "doc_123", "text": "Example", "embedding": [0.1] * 10},
+    ]
+
+    with pytest.raises(ValidationError) as exc_info:
+        Chunk.bulk_validate(rows)
+
+    assert exc_info.value.errors()[0]["loc"][:2] == (1, "embedding")
+
+
 @pytest.mark.unit
 def test_chunk_model_invalid_embedding():
     """Test chunk with wrong embedding dimension."""
@@ -34,6 +121,149 @@ def test_chunk_model_invalid_embedding():
     assert "1536-dim embedding" in str(exc_info.value)
 
 
+@pytest.mark.unit
+def test_chunk_embedding_stored_as_float32_array():
+    """Test embeddings are coerced to float32 arrays and serialized as lists."""
+    chunk = Chunk(document_id="doc_123", text="Example", embedding=[0.1] * 1536)
+
+    assert isinstance(chunk.embedding, np.ndarray)
+    assert chunk.embedding.dtype == np.float32
+    assert chunk.model_dump(mode="json")["embedding"] == pytest.approx([0.1] * 1536)
+
+
+@pytest.mark.unit
+def test_chunk_embedding_read_only_array_not_copied():
+    """Test read-only float32 buffers are used as-is."""
+    embedding = np.full(1536, 0.1, dtype=np.float32)
+    embedding.flags.writeable = False
+    chunk = Chunk(document_id="doc_123", text="Example", embedding=embedding)
+
+    assert chunk.embedding is embedding
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("construct", [Chunk, Chunk.from_trusted])
+def test_chunk_embedding_not_aliased(construct):
+    """Test writes to the caller's array don't reach the frozen chunk."""
+    embedding = np.full(1536, 0.1, dtype=np.float32)
+    chunk = construct(document_id="doc_123", text="Example", embedding=embedding)
+
+    embedding[0] = 5.0
+
+    assert chunk.embedding[0] == pytest.approx(0.1)
+    assert not chunk.embedding.flags.writeable
+    with pytest.raises(ValueError):
+        chunk.embedding[0] = 5.0
+
+
+@pytest.mark.unit
+def test_chunk_shared_embedding_not_copied():
+    """Test chunks share the read-only test embedding rather than copying it."""
+    chunks = [Chunk(document_id="doc_123", text=f"Example {i}", embedding=_EMB) for i in range(3)]
+
+    assert all(chunk.embedding is _EMB for chunk in chunks)
+
+
+@pytest.mark.unit
+def test_chunk_hashable_by_id():
+    """Test chunks hash by id despite the array field."""
+    chunk = Chunk(id="chunk_1", document_id="doc_123", text="Example", embedding=_EMB)
+
+    assert hash(chunk) == hash("chunk_1")
+    assert len({chunk, chunk.model_copy()}) == 1
+
+
+@pytest.mark.unit
+def test_chunk_embedding_strided_view_packed():
+    """Test strided embeddings (e.g., matrix columns) are stored contiguously."""
+    matrix = np.random.default_rng(0).random((1536, 2), dtype=np.float32)
+    chunk = Chunk(document_id="doc_123", text="Example", embedding=matrix[:, 0])
+
+    assert chunk.embedding.flags.c_contiguous
+    assert np.array_equal(chunk.embedding, matrix[:, 0])
+
+
+@pytest.mark.unit
+def test_chunk_embedding_invalid_shape():
+    """Test 2-D embeddings are rejected."""
+    with pytest.raises(ValidationError) as exc_info:
+        Chunk(document_id="doc_123", text="Example", embedding=np.zeros((2, 1536)))
+
+    assert "1536-dim embedding" in str(exc_info.value)
+
+
+@pytest.mark.unit
+def test_chunk_metadata_strings_interned():
+    """Test repeated metadata strings are shared between chunks."""
+    chunks = [
+        Chunk(
+            document_id="doc_123",
+            text="Example",
+            embedding=_EMB,
+            metadata={"".join(["sou", "rce"]): "".join(["manual", ".pdf"]), "page": i},
+        )
+        for i in range(2)
+    ]
+
+    (key_a, value_a), (key_b, value_b) = (next(iter(c.metadata.items())) for c in chunks)
+    assert key_a is key_b
+    assert value_a is value_b
+    assert chunks[1].metadata == {"source": "manual.pdf", "page": 1}
+
+
+@pytest.mark.unit
+def test_chunk_timestamps_are_utc():
+    """Test default timestamps are timezone-aware UTC."""
+    chunk = Chunk(document_id="doc_123", text="Example", embedding=_EMB)
+    assert chunk.created_at.utcoffset() == timedelta(0)
+
+
+@pytest.mark.unit
+def test_batch_now_shares_timestamp():
+    """Test models created in a batch share one timestamp."""
+    with batch_now() as now:
+        chunks = [
+            Chunk(document_id="doc_123", text=f"Example {i}", embedding=_EMB) for i in range(3)
+        ]
+        doc = Document(title="Test Doc", source_uri="file:///test.pdf")
+
+    assert {c.created_at for c in chunks} == {now}
+    assert doc.ingested_at == now
+
+    later = Chunk(document_id="doc_123", text="Example", embedding=_EMB)
+    assert later.created_at >= now
+
+
+@pytest.mark.unit
+def test_chunk_is_frozen():
+    """Test chunks are immutable (derive copies via model_copy)."""
+    chunk = Chunk(document_id="doc_123", text="Example text", embedding=_EMB)
+
+    with pytest.raises(ValidationError):
+        chunk.text = "Changed"
+
+    updated = chunk.model_copy(update={"text": "Changed"})
+    assert updated.text == "Changed"
+    assert chunk.text == "Example text"
+
+
+@pytest.mark.unit
+def test_chunk_token_set_cached_and_not_serialized():
+    """Test chunk tokens are computed once and kept out of dumps."""
+    chunk = Chunk(document_id="doc_123", text="Drone BATTERY drone", embedding=_EMB)
+
+    assert chunk.token_set == frozenset({"drone", "battery"})
+    assert chunk.token_set is chunk.token_set
+    assert "token_set" not in chunk.model_dump()
+
+    assert chunk.token_bits == token_bits({"drone", "battery"})
+    assert "token_bits" not in chunk.model_dump()
+
+    updated = chunk.model_copy(update={"text": "firmware update"})
+    assert updated.token_set == frozenset({"firmware", "update"})
+    assert updated.token_bits == token_bits({"firmware", "update"})
+
+
 @pytest.mark.unit
 def test_document_model():
     """Test document model."""
@@ -47,6 +277,21 @@ def test_document_model():
     assert doc.id.startswith("doc_")
 
 
+@pytest.mark.unit
+def test_retrieval_result_fast_to_pydantic():
+    """Test hot-path results convert to the validated model."""
+    chunk = Chunk(document_id="doc_123", text="Example", embedding=_EMB)
+    fast = RetrievalResultFast(chunk=chunk, score=0.5, rank=1)
+    fast.score *= 0.9
+
+    result = fast.to_pydantic()
+
+    assert isinstance(result, RetrievalResult)
+    assert result.chunk is chunk
+    assert result.score == pytest.approx(0.45)
+    assert RetrievalResultFast(chunk=chunk, score=1.0000001, rank=1).to_pydantic().score == 1.0
+
+
 @pytest.mark.unit
 def test_citation_format():
     """Test citation formatting."""
@@ -61,3 +306,17 @@ def test_citation_format():
     formatted = citation.format()
     assert "[manual.pdf, page 5]:" in formatted
     assert "This is cited text" in formatted
+
+
+@pytest.mark.unit
+def test_citation_format_computed_once():
+    """Test citation display string is cached and serialized."""
+    citation = Citation(
+        chunk_id="chunk_123",
+        document_id="doc_456",
+        text="Cited text.",
+        score=0.85,
+    )
+
+    assert citation.format() is citation.format()
+    assert citation.model_dump()["formatted"] == "[Unknown]: Cited text...."
@@ -1,11 +1,26 @@
 """Test text processing utilities."""
 
+import numpy as np
 import pytest
+from rag_core.utils import text as text_utils
 from rag_core.utils.text import clean_text
 
 
+@pytest.fixture(params=["numba", "regex"])
+def whitespace_backend(request, monkeypatch):
+    """Run clean_text tests against both whitespace collapsing backends."""
+    if request.param == "numba":
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(text_utils, "_get_numba_collapse", lambda: None)
+    # Cached results would skip the backend under test
+    text_utils._clean_text_cached.cache_clear()
+    yield request.param
+    text_utils._clean_text_cached.cache_clear()
+
+
 @pytest.mark.unit
-def test_clean_text():
+def test_clean_text(whitespace_backend):
     """Test text cleaning (no dependencies)."""
     dirty = "  Hello\n\n\nworld  \n  "
     clean = clean_text(dirty)
@@ -13,12 +28,62 @@ def test_clean_text():
 
 
 @pytest.mark.unit
-def test_clean_text_multiple_spaces():
+def test_clean_text_multiple_spaces(whitespace_backend):
     """Test multiple space removal."""
     text = "Hello    world"
     assert clean_text(text) == "Hello world"
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Already clean.\n\nParagraph two.", "Already clean.\n\nParagraph two."),
+        ("a\n\n\n\n\nb   c", "a\n\nb c"),
+        ("  ", ""),
+        ("Café  au lait\n\n\n\tnaïve  ", "Café au lait\n\n\tnaïve"),
+    ],
+)
+def test_clean_text_fast_paths(whitespace_backend, text, expected):
+    """Test clean and dirty inputs normalize identically."""
+    assert clean_text(text) == expected
+
+
+@pytest.mark.unit
+def test_clean_text_lone_surrogate(whitespace_backend):
+    """Test strings with lone surrogates clean like any other text."""
+    assert clean_text("a  b\ud800") == "a b\ud800"
+
+
+@pytest.mark.unit
+def test_clean_text_cached():
+    """Test repeated passages are served from the cache."""
+    text = "Hello    world " + "x" * 40
+
+    assert clean_text(text) is clean_text(text)
+
+
+@pytest.mark.unit
+def test_clean_text_long_input_not_cached(monkeypatch):
+    """Test inputs over the size limit bypass the cache."""
+    monkeypatch.setattr(text_utils, "_CLEAN_CACHE_MAX_CHARS", 8)
+    text_utils._clean_text_cached.cache_clear()
+
+    assert clean_text("Hello    world") == "Hello world"
+    assert text_utils._clean_text_cached.cache_info().currsize == 0
+
+
+@pytest.mark.unit
+def test_collapse_whitespace_reference_version():
+    """Test the plain-Python body of the numba kernel (numba's py_func)."""
+    buf = np.frombuffer(b"a  \n\n\n\nb", dtype=np.uint8)
+    out = np.empty_like(buf)
+
+    n = text_utils._collapse_whitespace(buf, out)
+
+    assert out[:n].tobytes() == b"a \n\nb"
+
+
 # Token counting tests require tiktoken (Stage 5+ with [llm] extras)
 # These tests are skipped in Stage 3 CI (hermetic requirement)
 
@@ -37,6 +102,17 @@ def test_count_tokens():
     assert 2 <= token_count <= 5
 
 
+@pytest.mark.skip(reason="Requires tiktoken - install rag-core[llm] to enable")
+@pytest.mark.unit
+def test_count_tokens_batch():
+    """Test batch token counting matches per-text counting (requires tiktoken)."""
+    from rag_core.utils.text import count_tokens, count_tokens_batch
+
+    texts = ["Hello, world!", "", "Drone battery life " * 50]
+
+    assert count_tokens_batch(texts) == [count_tokens(t) for t in texts]
+
+
 @pytest.mark.skip(reason="Requires tiktoken - install rag-core[llm] to enable")
 @pytest.mark.unit
 def test_truncate_text():
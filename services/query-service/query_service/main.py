@@ -1,15 +1,52 @@
-from fastapi import FastAPI
+"""Aeroknite query service (Starlette app, served by uvicorn with uvloop + httptools).
 
-app = FastAPI(title="Aeroknite Query Service", version="0.1.0")
+Plain Starlette: the probes need no request validation or dependency
+injection, so the FastAPI layer would only add import time and per-request
+overhead. Handlers are `async def`: sync endpoints are dispatched to a worker
+thread (run_in_threadpool). Keep blocking I/O out of async handlers.
+"""
 
+import os
 
-@app.get("/health")
-def health() -> dict:
-    return {"status": "ok"}
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
 
+# Probe bodies never change: encoded once at import, and the same Response is
+# returned on every probe (no dict or JSON encoding per request).
+# Shared instances: never mutate them (e.g., headers) in handlers or middleware.
+_HEALTH_RESPONSE = Response(content=b'{"status":"ok"}', media_type="application/json")
+_READY_RESPONSE = Response(content=b'{"status":"ready"}', media_type="application/json")
 
-@app.get("/ready")
-def ready() -> dict:
+
+async def health(request: Request) -> Response:
+    return _HEALTH_RESPONSE
+
+
+async def ready(request: Request) -> Response:
     # Stage 2: readiness = process is running.
-    # Stage 5+: readiness will validate DB/Redis/model connectivity.
-    return {"status": "ready"}
+    # Stage 5+: readiness will validate DB/Redis/model connectivity; cache the
+    # result for ~1s so a probe storm doesn't hammer the dependencies.
+    return _READY_RESPONSE
+
+
+app = Starlette(
+    routes=[
+        Route("/health", health, methods=["GET"]),
+        Route("/ready", ready, methods=["GET"]),
+    ]
+)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "query_service.main:app",
+        host="0.0.0.0",
+        port=int(os.environ.get("PORT", "8000")),
+        loop="uvloop",  # C event loop (libuv)
+        http="httptools",  # C HTTP parser
+        workers=int(os.environ.get("WEB_CONCURRENCY", "1")),
+    )
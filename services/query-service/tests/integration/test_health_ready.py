@@ -1,42 +1,50 @@
-import json
-import os
-import time
-import urllib.error
-import urllib.request
-
-import pytest
-
-
-@pytest.mark.integration
-def test_query_service_health_ready() -> None:
-    if os.getenv("RUN_INTEGRATION") != "1":
-        pytest.skip("Integration tests disabled. Set RUN_INTEGRATION=1 to enable.")
-
-    base_url = "http://localhost:8000"
-    max_retries = 30
-    retry_delay_seconds = 1
-
-    def fetch(path: str) -> str:
-        last_err: Exception | None = None
-        for attempt in range(1, max_retries + 1):
-            try:
-                with urllib.request.urlopen(f"{base_url}{path}", timeout=5) as resp:
-                    data = resp.read()
-                    assert isinstance(data, (bytes, bytearray))
-                    return data.decode("utf-8")
-
-            except (urllib.error.URLError, OSError) as e:
-                last_err = e
-                if attempt < max_retries:
-                    time.sleep(retry_delay_seconds)
-        total_wait_seconds = retry_delay_seconds * (max_retries - 1)
-        raise AssertionError(
-            f"Failed to reach {path} after {max_retries} attempts "
-            f"({total_wait_seconds}s total wait): {last_err}"
-        )
-
-    health = json.loads(fetch("/health"))
-    ready = json.loads(fetch("/ready"))
-
-    assert health.get("status") == "ok"
-    assert ready.get("status") == "ready"
+import asyncio
+import os
+
+import httpx
+import pytest
+from rag_core.utils import retry_with_backoff_async
+
+BASE_URL = "http://localhost:8000"
+
+# Total time to wait for the service to come up, and the cap on a single
+# backoff delay (so a service ready in 200 ms isn't polled once per second)
+STARTUP_TIMEOUT_SECONDS = 15.0
+MAX_DELAY_SECONDS = 0.5
+
+
+async def _probe(path: str) -> dict:
+    # One keep-alive client shared by every attempt; identity encoding skips
+    # compression negotiation for a ~20-byte body
+    async with httpx.AsyncClient(
+        base_url=BASE_URL, timeout=5, headers={"Accept-Encoding": "identity"}
+    ) as client:
+
+        @retry_with_backoff_async(
+            max_retries=1_000,  # Bounded by the time budget, not the attempt count
+            initial_delay=0.05,
+            max_delay=MAX_DELAY_SECONDS,
+            jitter="full",
+            exceptions=(httpx.HTTPError,),
+            max_total_time=STARTUP_TIMEOUT_SECONDS,
+        )
+        async def probe() -> dict:
+            response = await client.get(path)
+            response.raise_for_status()
+            body: dict = response.json()  # Parsed straight from bytes (no str decode)
+            return body
+
+        return await probe()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("path, expected", [("/health", "ok"), ("/ready", "ready")])
+def test_query_service_health_ready(path: str, expected: str) -> None:
+    # Real TCP against the running container (validates networking and uvicorn);
+    # handler behaviour is covered in-process by tests/unit
+    if os.getenv("RUN_INTEGRATION") != "1":
+        pytest.skip("Integration tests disabled. Set RUN_INTEGRATION=1 to enable.")
+
+    body = asyncio.run(_probe(path))
+
+    assert body.get("status") == expected
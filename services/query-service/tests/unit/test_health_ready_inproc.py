@@ -0,0 +1,33 @@
+"""Test query-service probes in-process (ASGI TestClient, no socket or server)."""
+
+from collections.abc import Iterator
+
+import pytest
+from query_service.main import app
+from starlette.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    # Entered once: app startup/shutdown (lifespan) runs once per session
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.unit
+def test_health(client: TestClient) -> None:
+    """Test /health reports ok."""
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.unit
+def test_ready(client: TestClient) -> None:
+    """Test /ready reports ready."""
+    response = client.get("/ready")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready"}